@@ -1,7 +1,90 @@
-from django.contrib import admin
+from functools import lru_cache
+from django import forms
+from django.contrib import admin, messages
+from django.contrib.admin.helpers import ActionForm
+from django.conf import settings
+from django.urls import reverse
+from django.db.models import Count, Q
 from django.utils.html import format_html
 from django.utils.safestring import mark_safe
-from .models import Category, Tag, AuthorProfile, Article, NewsletterSubscriber
+from .models import Category, Tag, AuthorProfile, Article, NewsletterSubscriber, VideoUpload
+from services.bulk import ArticleBulkService
+
+THUMBNAIL_WIDTH = 100
+THUMBNAIL_HEIGHT = 60
+
+
+@lru_cache(maxsize=4096)
+def thumbnail_url(name):
+    """Маленька мініатюра для списків адмінки (URL залежить лише від імені файлу)"""
+    try:
+        import cloudinary.utils
+        return cloudinary.utils.cloudinary_url(
+            name,
+            resource_type='image',
+            width=THUMBNAIL_WIDTH,
+            height=THUMBNAIL_HEIGHT,
+            crop='fill',
+            fetch_format='auto',
+            quality='auto',
+            secure=True,
+        )[0]
+    except Exception:
+        return Article._meta.get_field('featured_image').storage.url(name)
+
+
+class ArticleActionForm(ActionForm):
+    """Додаткові поля для масових дій зі статтями"""
+    category = forms.ModelChoiceField(
+        queryset=Category.objects.all(),
+        required=False,
+        label='Категорія',
+    )
+    tag_names = forms.CharField(
+        required=False,
+        label='Теги',
+        help_text='Назви через кому',
+    )
+
+
+class ResumableVideoInput(forms.ClearableFileInput):
+    """
+    Поле відео, що завантажує файл частинами напряму на сервер
+    (services/uploads.py); форма надсилає лише id завершеного завантаження
+    """
+    class Media:
+        js = ['js/admin/resumable_upload.js']
+
+    def render(self, name, value, attrs=None, renderer=None):
+        return format_html(
+            '<div class="resumable-upload" data-create-url="{}" data-chunk-size="{}">'
+            '{}<input type="hidden" name="{}_upload" value="">'
+            '<div><progress value="0" max="1" hidden></progress> <span class="resumable-upload-status"></span></div>'
+            '</div>',
+            reverse('articles:video_upload_create'),
+            settings.RESUMABLE_UPLOAD_CHUNK_SIZE,
+            super().render(name, value, attrs, renderer),
+            name,
+        )
+
+
+class ArticleAdminForm(forms.ModelForm):
+    class Meta:
+        model = Article
+        fields = '__all__'
+        widgets = {
+            'featured_video': ResumableVideoInput,
+        }
+
+    def clean_featured_video(self):
+        upload_id = self.data.get('featured_video_upload')
+        if not upload_id:
+            return self.cleaned_data['featured_video']
+        upload = VideoUpload.objects.filter(pk=upload_id, status=VideoUpload.STATUS_COMPLETE).first()
+        if upload is None:
+            raise forms.ValidationError('Завантаження відео ще не завершено')
+        # Файл уже в storage - зберігається лише посилання на нього
+        return upload.asset_name
 
 
 @admin.register(Category)
@@ -12,15 +95,16 @@ class CategoryAdmin(admin.ModelAdmin):
     prepopulated_fields = {'slug': ('name',)}
     ordering = ['order', 'name']
 
+    def get_queryset(self, request):
+        # Кількість статей рахується одним запитом для всієї сторінки списку
+        return super().get_queryset(request).annotate(
+            published_count=Count('articles', filter=Q(articles__status='published'))
+        )
+
     def article_count(self, obj):
-        try:
-            if obj and obj.pk:
-                return obj.articles.filter(status='published').count()
-            return 0
-        except (AttributeError, Exception) as e:
-            return 0
+        return getattr(obj, 'published_count', 0)
     article_count.short_description = 'Статей'
-    article_count.admin_order_field = None  # Вимкнути сортування
+    article_count.admin_order_field = 'published_count'
 
 
 @admin.register(Tag)
@@ -28,16 +112,19 @@ class TagAdmin(admin.ModelAdmin):
     list_display = ['name', 'slug', 'article_count']
     search_fields = ['name']
     prepopulated_fields = {'slug': ('name',)}
+    # Meta.ordering ігнорується для запитів з GROUP BY, тому вказуємо явно
+    ordering = ['name']
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            published_count=Count('articles', filter=Q(articles__status='published'))
+        )
 
     def article_count(self, obj):
-        try:
-            if obj and obj.pk:
-                return obj.articles.filter(status='published').count()
-            return 0
-        except (AttributeError, Exception) as e:
-            return 0
+        return getattr(obj, 'published_count', 0)
     article_count.short_description = 'Статей'
-    article_count.admin_order_field = None  # Вимкнути сортування
+    article_count.admin_order_field = 'published_count'
 
 
 @admin.register(AuthorProfile)
@@ -45,6 +132,7 @@ class AuthorProfileAdmin(admin.ModelAdmin):
     list_display = ['user', 'role', 'article_count', 'created_at']
     list_filter = ['role', 'created_at']
     search_fields = ['user__username', 'user__email', 'bio']
+    list_select_related = ['user']
     fieldsets = (
         ('Основна інформація', {
             'fields': ('user', 'role', 'bio', 'avatar')
@@ -55,26 +143,35 @@ class AuthorProfileAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            published_count=Count('user__articles', filter=Q(user__articles__status='published'))
+        )
+
     def article_count(self, obj):
-        try:
-            if obj and obj.user and hasattr(obj.user, 'pk') and obj.user.pk:
-                return obj.user.articles.filter(status='published').count()
-            return 0
-        except (AttributeError, Exception) as e:
-            return 0
+        return getattr(obj, 'published_count', 0)
     article_count.short_description = 'Статей'
-    article_count.admin_order_field = None  # Вимкнути сортування
+    article_count.admin_order_field = 'published_count'
 
 
 @admin.register(Article)
 class ArticleAdmin(admin.ModelAdmin):
+    form = ArticleAdminForm
     list_display = ['title', 'author', 'category', 'status', 'is_featured', 'views_count', 'published_at', 'preview_image']
     list_filter = ['status', 'is_featured', 'category', 'created_at', 'published_at']
     search_fields = ['title', 'content', 'short_description']
     prepopulated_fields = {'slug': ('title',)}
-    readonly_fields = ['views_count', 'reading_time', 'created_at', 'updated_at']
-    filter_horizontal = ['tags']
+    readonly_fields = ['views_count', 'trending_score', 'unique_readers', 'reading_time', 'created_at', 'updated_at']
+    list_select_related = ['author', 'category']
+    autocomplete_fields = ['author', 'tags']
+    # Без COUNT(*) по всій таблиці на кожній сторінці списку
+    show_full_result_count = False
     date_hierarchy = 'published_at'
+    action_form = ArticleActionForm
+    actions = [
+        'publish_articles', 'unpublish_articles', 'feature_articles', 'unfeature_articles',
+        'change_category', 'add_tags', 'remove_tags',
+    ]
     
     fieldsets = (
         ('Основна інформація', {
@@ -85,7 +182,9 @@ class ArticleAdmin(admin.ModelAdmin):
         }),
         ('Відео', {
             'fields': ('featured_video',),
-            'description': 'Завантажте відео файл. Відео буде збережено на Cloudinary.',
+            'description': 'Завантажте відео файл. Файл надсилається частинами (перерване '
+                           'завантаження продовжиться, якщо обрати той самий файл ще раз) '
+                           'і буде збережено на Cloudinary.',
             'classes': ('collapse',)
         }),
         ('SEO', {
@@ -96,20 +195,87 @@ class ArticleAdmin(admin.ModelAdmin):
             'fields': ('status', 'is_featured', 'published_at')
         }),
         ('Статистика', {
-            'fields': ('views_count', 'reading_time', 'created_at', 'updated_at'),
+            'fields': ('views_count', 'trending_score', 'unique_readers', 'reading_time', 'created_at', 'updated_at'),
             'classes': ('collapse',)
         }),
     )
 
     def preview_image(self, obj):
         try:
-            if obj.featured_image and obj.featured_image.url:
-                return format_html('<img src="{}" width="100" height="60" style="object-fit: cover;" />', obj.featured_image.url)
+            if obj.featured_image:
+                return format_html(
+                    '<img src="{}" width="{}" height="{}" style="object-fit: cover;" loading="lazy" />',
+                    thumbnail_url(obj.featured_image.name), THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT,
+                )
             return '-'
         except Exception:
             return '-'
     preview_image.short_description = 'Зображення'
 
+    def unique_readers(self, obj):
+        if not obj.pk:
+            return '-'
+        from services.readers import UniqueReaderService
+        stats = UniqueReaderService.get_reader_stats(obj.pk)
+        return f"{stats[7]} за 7 днів / {stats[30]} за 30 днів"
+    unique_readers.short_description = 'Унікальні читачі'
+
+    # ---------- Масові дії (services/bulk.py) ----------
+
+    @admin.action(description='Опублікувати вибрані статті')
+    def publish_articles(self, request, queryset):
+        count = ArticleBulkService.publish(queryset)
+        self.message_user(request, f'Опубліковано статей: {count}', messages.SUCCESS)
+
+    @admin.action(description='Зняти з публікації')
+    def unpublish_articles(self, request, queryset):
+        count = ArticleBulkService.unpublish(queryset)
+        self.message_user(request, f'Знято з публікації: {count}', messages.SUCCESS)
+
+    @admin.action(description='Зробити рекомендованими')
+    def feature_articles(self, request, queryset):
+        count = ArticleBulkService.set_featured(queryset, True)
+        self.message_user(request, f'Рекомендованих статей: {count}', messages.SUCCESS)
+
+    @admin.action(description='Прибрати з рекомендованих')
+    def unfeature_articles(self, request, queryset):
+        count = ArticleBulkService.set_featured(queryset, False)
+        self.message_user(request, f'Прибрано з рекомендованих: {count}', messages.SUCCESS)
+
+    @admin.action(description='Змінити категорію (вкажіть категорію)')
+    def change_category(self, request, queryset):
+        category = Category.objects.filter(pk=request.POST.get('category') or None).first()
+        if category is None:
+            self.message_user(request, 'Оберіть категорію для переміщення статей', messages.WARNING)
+            return
+        count = ArticleBulkService.set_category(queryset, category)
+        self.message_user(request, f'Переміщено в «{category}»: {count}', messages.SUCCESS)
+
+    def _action_tags(self, request):
+        """Існуючі теги з поля tag_names та назви, яких не знайдено"""
+        names = [name.strip() for name in request.POST.get('tag_names', '').split(',') if name.strip()]
+        tags = list(Tag.objects.filter(name__in=names))
+        missing = set(names) - {tag.name for tag in tags}
+        if missing:
+            self.message_user(request, f'Теги не знайдено: {", ".join(sorted(missing))}', messages.WARNING)
+        return tags
+
+    @admin.action(description='Додати теги (вкажіть назви)')
+    def add_tags(self, request, queryset):
+        tags = self._action_tags(request)
+        if not tags:
+            return
+        count = ArticleBulkService.add_tags(queryset, tags)
+        self.message_user(request, f'Теги додано до статей: {count}', messages.SUCCESS)
+
+    @admin.action(description='Прибрати теги (вкажіть назви)')
+    def remove_tags(self, request, queryset):
+        tags = self._action_tags(request)
+        if not tags:
+            return
+        count = ArticleBulkService.remove_tags(queryset, tags)
+        self.message_user(request, f'Теги прибрано зі статей: {count}', messages.SUCCESS)
+
     def save_model(self, request, obj, form, change):
         try:
             if not change and not obj.author:  # Нова стаття без автора
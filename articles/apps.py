@@ -5,3 +5,6 @@ class ArticlesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'articles'
 
+    def ready(self):
+        # Підключаємо сигнали інвалідації кешу
+        from articles import signals  # noqa: F401
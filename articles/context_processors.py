@@ -1,28 +1,12 @@
 """
 Context processors для глобального доступу до даних
 """
-from articles.models import Category
-from django.db import OperationalError, DatabaseError
+from services.navigation import NavigationService
 
 
 def categories(request):
-    """Додати всі активні категорії до контексту"""
-    # Не додаємо категорії для адмінки, щоб уникнути помилок
-    if not request or not hasattr(request, 'path'):
-        return {'categories': []}
-    
-    if request.path.startswith('/admin/'):
-        return {'categories': []}
-    
-    try:
-        # Отримуємо категорії як QuerySet, але не копіюємо контекст для адмінки
-        return {
-            'categories': Category.objects.filter(is_active=True).order_by('order', 'name')
-        }
-    except (OperationalError, DatabaseError):
-        # Якщо таблиці ще не створені (під час першого деплою або міграції не застосовані)
-        return {'categories': []}
-    except Exception:
-        # Будь-яка інша помилка - повертаємо порожній список
-        return {'categories': []}
-
+    """Додати активні категорії (закешований незмінний кортеж) до контексту"""
+    # Адмінці категорії не потрібні
+    if request is None or request.path.startswith('/admin/'):
+        return {}
+    return {'categories': NavigationService.get_categories()}
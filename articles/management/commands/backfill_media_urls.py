@@ -0,0 +1,48 @@
+"""
+Команда для заповнення готових URL медіа статей (image_url, video_file_url)
+python manage.py backfill_media_urls
+"""
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from articles.models import Article, resolve_image_url, resolve_video_url
+from services.cache import ARTICLE_NAMESPACES, bump
+
+BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = 'Обчислює та зберігає URL зображень і відео статей, збережених до появи полів з URL'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Перерахувати URL усіх статей (наприклад, після зміни налаштувань storage)',
+        )
+
+    def handle(self, *args, **options):
+        queryset = Article.objects.exclude(featured_image='', featured_video='')
+        if not options['all']:
+            queryset = queryset.filter(
+                Q(~Q(featured_image='') & Q(image_url=''))
+                | Q(~Q(featured_video='') & Q(video_file_url=''))
+            )
+
+        updated = 0
+        batch = []
+        rows = queryset.order_by('id').values_list('id', 'featured_image', 'featured_video')
+        for pk, image, video in rows.iterator(chunk_size=BATCH_SIZE):
+            batch.append(Article(
+                id=pk,
+                image_url=resolve_image_url(image) if image else '',
+                video_file_url=resolve_video_url(video) if video else '',
+            ))
+            if len(batch) >= BATCH_SIZE:
+                updated += Article.objects.bulk_update(batch, ['image_url', 'video_file_url'])
+                batch = []
+        if batch:
+            updated += Article.objects.bulk_update(batch, ['image_url', 'video_file_url'])
+
+        if updated:
+            bump(*ARTICLE_NAMESPACES)
+        self.stdout.write(self.style.SUCCESS(f'✓ Оновлено URL медіа статей: {updated}'))
@@ -0,0 +1,34 @@
+"""
+Команда для перегляду статистики дворівневого кешу
+python manage.py cache_stats
+"""
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Показує частку влучань у L1/L2 кеш для всіх воркерів'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='Скинути накопичену статистику',
+        )
+
+    def handle(self, *args, **options):
+        if not hasattr(cache, 'shared_stats'):
+            self.stdout.write(self.style.WARNING('Кеш за замовчуванням не є дворівневим (TwoTierCache)'))
+            return
+
+        if options['reset']:
+            cache.reset_stats()
+            self.stdout.write(self.style.SUCCESS('✓ Статистику кешу скинуто'))
+            return
+
+        stats = cache.shared_stats()
+        self.stdout.write(f'Запитів:        {stats["requests"]}')
+        self.stdout.write(f'Влучань у L1:   {stats["l1_hits"]} ({stats["l1_hit_ratio"]:.1%})')
+        self.stdout.write(f'Влучань у L2:   {stats["l2_hits"]} ({stats["l2_hit_ratio"]:.1%})')
+        self.stdout.write(f'Промахів:       {stats["misses"]}')
+        self.stdout.write(self.style.SUCCESS(f'Загальна частка влучань: {stats["hit_ratio"]:.1%}'))
@@ -0,0 +1,19 @@
+"""
+Команда для запису накопичених переглядів статей у БД
+python manage.py flush_view_counts
+"""
+from django.core.management.base import BaseCommand
+from services.view_counter import view_counter
+
+
+class Command(BaseCommand):
+    help = 'Записує в БД перегляди статей, накопичені в буфері (спільному буфері Redis)'
+
+    def handle(self, *args, **options):
+        if not view_counter.buffer.shared:
+            self.stdout.write(self.style.WARNING(
+                'Буфер переглядів зберігається в пам\'яті воркерів і скидається ними самостійно'
+            ))
+            return
+        total = view_counter.flush()
+        self.stdout.write(self.style.SUCCESS(f'✓ Записано переглядів: {total}'))
@@ -0,0 +1,68 @@
+"""
+Команда для обчислення LQIP-заглушок і основного кольору вже збережених зображень статей
+python manage.py generate_image_placeholders
+"""
+from io import BytesIO
+from django.core.management.base import BaseCommand
+from PIL import Image, UnidentifiedImageError
+from articles.models import Article, resolve_image_url
+from services.cache import ARTICLE_NAMESPACES, bump
+from services.image_fetcher import ImageFetcher
+from services.image_processing import COLOR_SAMPLE_SIZE, describe_image
+from services.responsive_images import thumbnail_url
+
+BATCH_SIZE = 200
+
+
+class Command(BaseCommand):
+    help = 'Обчислює заглушки (LQIP) та основний колір для зображень статей, збережених без них'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Перерахувати заглушки всіх статей із зображенням',
+        )
+
+    def preview(self, fetcher, url):
+        """(placeholder, color) зменшеної копії зображення або None"""
+        image = fetcher.get(thumbnail_url(url, COLOR_SAMPLE_SIZE))
+        if image is None:
+            return None
+        try:
+            with Image.open(BytesIO(image.data)) as picture:
+                picture.load()
+                return describe_image(picture)
+        except (UnidentifiedImageError, OSError):
+            return None
+
+    def handle(self, *args, **options):
+        queryset = Article.objects.exclude(featured_image='')
+        if not options['all']:
+            queryset = queryset.filter(image_placeholder='')
+        rows = list(queryset.order_by('id').values_list('id', 'featured_image', 'image_url'))
+
+        fetcher = ImageFetcher()
+        updated = failed = 0
+        try:
+            for start in range(0, len(rows), BATCH_SIZE):
+                batch = rows[start:start + BATCH_SIZE]
+                urls = {pk: image_url or resolve_image_url(name) for pk, name, image_url in batch}
+                fetcher.prefetch(thumbnail_url(url, COLOR_SAMPLE_SIZE) for url in urls.values())
+                previews = dict(zip(urls, fetcher.map(lambda url: self.preview(fetcher, url), urls.values())))
+                articles = []
+                for pk, preview in previews.items():
+                    if preview is None:
+                        failed += 1
+                        self.stdout.write(self.style.WARNING(f'  ⚠ Не вдалося обробити зображення статті {pk}'))
+                        continue
+                    placeholder, color = preview
+                    articles.append(Article(id=pk, image_placeholder=placeholder, image_color=color))
+                updated += Article.objects.bulk_update(articles, ['image_placeholder', 'image_color'])
+                fetcher.clear()
+        finally:
+            fetcher.close()
+
+        if updated:
+            bump(*ARTICLE_NAMESPACES)
+        self.stdout.write(self.style.SUCCESS(f'✓ Оновлено заглушок зображень: {updated} (помилок: {failed})'))
@@ -0,0 +1,16 @@
+"""
+Команда для повного перерахунку схожих статей
+python manage.py rebuild_related_articles
+"""
+from django.core.management.base import BaseCommand
+from services.cache import ARTICLE_NAMESPACES, bump
+from services.related import RelatedArticleService
+
+
+class Command(BaseCommand):
+    help = 'Перераховує таблицю схожих статей (теги, категорія, свіжість)'
+
+    def handle(self, *args, **options):
+        count = RelatedArticleService.rebuild_all()
+        bump(*ARTICLE_NAMESPACES)
+        self.stdout.write(self.style.SUCCESS(f'✓ Збережено зв\'язків: {count}'))
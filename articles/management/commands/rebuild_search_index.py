@@ -0,0 +1,38 @@
+"""
+Команда для повної перебудови пошукового індексу статей
+python manage.py rebuild_search_index
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from articles.models import Article
+from services.search import get_search_backend, DatabaseSearchBackend
+
+BATCH_SIZE = 500
+
+
+class Command(BaseCommand):
+    help = 'Перебудовує повнотекстовий пошуковий індекс опублікованих статей'
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        if isinstance(backend, DatabaseSearchBackend):
+            self.stdout.write(self.style.WARNING('Повнотекстовий індекс недоступний для цієї БД (застосуйте міграції)'))
+            return
+
+        rows = Article.objects.filter(status='published').order_by('id').values_list(
+            'id', 'title', 'short_description', 'content'
+        )
+        total = 0
+        with transaction.atomic():
+            backend.clear()
+            batch = []
+            for row in rows.iterator(chunk_size=BATCH_SIZE):
+                batch.append(row)
+                if len(batch) >= BATCH_SIZE:
+                    backend.index(batch)
+                    total += len(batch)
+                    batch = []
+            backend.index(batch)
+            total += len(batch)
+
+        self.stdout.write(self.style.SUCCESS(f'✓ Проіндексовано статей: {total}'))
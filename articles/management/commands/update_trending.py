@@ -0,0 +1,16 @@
+"""
+Команда для перерахунку трендової оцінки статей
+python manage.py update_trending
+"""
+from django.core.management.base import BaseCommand
+from services.cache import POPULAR, HOME, bump
+from services.trending import TrendingService
+
+
+class Command(BaseCommand):
+    help = 'Перераховує трендову оцінку статей з денної статистики переглядів'
+
+    def handle(self, *args, **options):
+        count = TrendingService.rollup()
+        bump(POPULAR, HOME)
+        self.stdout.write(self.style.SUCCESS(f'✓ Оновлено оцінки статей: {count}'))
@@ -0,0 +1,30 @@
+# Повнотекстовий індекс статей: FTS5 для SQLite, tsvector + GIN для PostgreSQL
+from django.db import migrations
+from services.search import create_search_index, drop_search_index, get_backend_for_connection
+
+
+def create_index(apps, schema_editor):
+    create_search_index(schema_editor.connection)
+    backend = get_backend_for_connection(schema_editor.connection)
+    if backend is None:
+        return
+    Article = apps.get_model('articles', 'Article')
+    rows = Article.objects.using(schema_editor.connection.alias).filter(
+        status='published'
+    ).values_list('id', 'title', 'short_description', 'content')
+    backend.index(list(rows), conn=schema_editor.connection)
+
+
+def drop_index(apps, schema_editor):
+    drop_search_index(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0003_remove_article_video_url'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
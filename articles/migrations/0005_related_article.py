@@ -0,0 +1,40 @@
+# Generated by Django 5.1.3 on 2026-10-18 19:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+from services.related import RelatedArticleService
+
+
+def build_related(apps, schema_editor):
+    RelatedArticleService.rebuild_all(
+        apps.get_model('articles', 'Article'),
+        apps.get_model('articles', 'RelatedArticle'),
+        schema_editor.connection.alias,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0004_article_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RelatedArticle',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField(verbose_name='Оцінка схожості')),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_links', to='articles.article', verbose_name='Стаття')),
+                ('related', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='articles.article', verbose_name='Схожа стаття')),
+            ],
+            options={
+                'verbose_name': 'Схожа стаття',
+                'verbose_name_plural': 'Схожі статті',
+                'ordering': ['article', '-score'],
+                'indexes': [models.Index(fields=['article', '-score'], name='articles_re_article_9d4063_idx')],
+                'constraints': [models.UniqueConstraint(fields=('article', 'related'), name='unique_related_article')],
+            },
+        ),
+        migrations.RunPython(build_related, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.1.3 on 2026-10-18 19:39
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0005_related_article'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleViewStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='Дата')),
+                ('views', models.PositiveIntegerField(default=0, verbose_name='Переглядів')),
+            ],
+            options={
+                'verbose_name': 'Статистика переглядів',
+                'verbose_name_plural': 'Статистика переглядів',
+                'ordering': ['-date'],
+            },
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='trending_score',
+            field=models.FloatField(default=0, verbose_name='Популярність зараз'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['status', '-trending_score'], name='articles_ar_status_91c814_idx'),
+        ),
+        migrations.AddField(
+            model_name='articleviewstat',
+            name='article',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='view_stats', to='articles.article', verbose_name='Стаття'),
+        ),
+        migrations.AddIndex(
+            model_name='articleviewstat',
+            index=models.Index(fields=['date'], name='articles_ar_date_fdb146_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='articleviewstat',
+            constraint=models.UniqueConstraint(fields=('article', 'date'), name='unique_article_view_stat'),
+        ),
+    ]
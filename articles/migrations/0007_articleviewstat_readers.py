@@ -0,0 +1,18 @@
+# Generated by Django 5.1.3 on 2026-10-18 19:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0006_article_view_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='articleviewstat',
+            name='readers',
+            field=models.BinaryField(blank=True, null=True, verbose_name='Унікальні читачі (скетч)'),
+        ),
+    ]
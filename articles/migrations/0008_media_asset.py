@@ -0,0 +1,36 @@
+# Generated by Django 5.1.3 on 2026-10-18 20:02
+
+import articles.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0007_articleviewstat_readers'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='article',
+            name='featured_image',
+            field=models.ImageField(blank=True, null=True, storage=articles.storage.DeduplicatedMediaCloudinaryStorage(), upload_to='articles/', verbose_name='Головне зображення'),
+        ),
+        migrations.CreateModel(
+            name='MediaAsset',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, verbose_name='SHA-256')),
+                ('source_url', models.URLField(blank=True, db_index=True, max_length=500, verbose_name='URL джерела')),
+                ('name', models.CharField(max_length=255, verbose_name="Ім'я в storage")),
+                ('size', models.PositiveIntegerField(default=0, verbose_name='Розмір (байт)')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Медіафайл',
+                'verbose_name_plural': 'Медіафайли',
+                'ordering': ['-created_at'],
+                'constraints': [models.UniqueConstraint(fields=('sha256', 'source_url'), name='unique_media_asset_source')],
+            },
+        ),
+    ]
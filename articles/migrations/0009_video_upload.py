@@ -0,0 +1,37 @@
+# Generated by Django 5.1.3 on 2026-10-18 20:05
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0008_media_asset'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VideoUpload',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('filename', models.CharField(max_length=255, verbose_name="Ім'я файлу")),
+                ('size', models.BigIntegerField(verbose_name='Розмір (байт)')),
+                ('offset', models.BigIntegerField(default=0, verbose_name='Отримано (байт)')),
+                ('status', models.CharField(choices=[('uploading', 'Завантажується'), ('processing', 'Зберігається в storage'), ('complete', 'Завершено'), ('failed', 'Помилка')], default='uploading', max_length=20, verbose_name='Статус')),
+                ('asset_name', models.CharField(blank=True, max_length=255, verbose_name="Ім'я в storage")),
+                ('error', models.TextField(blank=True, verbose_name='Помилка')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Користувач')),
+            ],
+            options={
+                'verbose_name': 'Завантаження відео',
+                'verbose_name_plural': 'Завантаження відео',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.3 on 2026-10-18 20:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0009_video_upload'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='image_url',
+            field=models.CharField(blank=True, editable=False, max_length=500, verbose_name='URL зображення'),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='video_file_url',
+            field=models.CharField(blank=True, editable=False, max_length=500, verbose_name='URL відео'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.3 on 2026-10-18 20:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0010_article_media_urls'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='image_color',
+            field=models.CharField(blank=True, editable=False, max_length=7, verbose_name='Основний колір зображення'),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='image_placeholder',
+            field=models.TextField(blank=True, editable=False, verbose_name='Заглушка зображення'),
+        ),
+    ]
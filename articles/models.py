@@ -5,9 +5,11 @@ from django.urls import reverse
 from django.utils import timezone
 import math
 import os
+import uuid
+from functools import lru_cache
 from decouple import config
 from cloudinary_storage.storage import MediaCloudinaryStorage
-from articles.storage import VideoCloudinaryStorage
+from articles.storage import VideoCloudinaryStorage, DeduplicatedMediaCloudinaryStorage
 
 # Визначаємо, чи використовувати Cloudinary
 # Читаємо CLOUDINARY_URL з .env файлу або змінних середовища
@@ -113,6 +115,14 @@ class AuthorProfile(models.Model):
         return reverse('articles:author_detail', kwargs={'username': self.user.username})
 
 
+# Поле файлу -> поля, що обчислюються з файлу при збереженні (URL, заглушка)
+MEDIA_DERIVED_FIELDS = {
+    'featured_image': ('image_url', 'image_placeholder', 'image_color'),
+    'featured_video': ('video_file_url',),
+}
+MEDIA_URL_CACHE_SIZE = 4096
+
+
 class Article(models.Model):
     """Стаття/публікація"""
     STATUS_CHOICES = [
@@ -137,7 +147,7 @@ class Article(models.Model):
         upload_to='articles/', 
         blank=True, 
         null=True, 
-        storage=MediaCloudinaryStorage(),
+        storage=DeduplicatedMediaCloudinaryStorage(),
         verbose_name="Головне зображення"
     )
     # VideoCloudinaryStorage автоматично визначає відео за шляхом 'articles/videos/' і встановлює resource_type='video'
@@ -148,6 +158,12 @@ class Article(models.Model):
         storage=VideoCloudinaryStorage(),
         verbose_name="Відео (файл)"
     )
+    # Готові URL медіа, обчислюються при збереженні (resolve_image_url/resolve_video_url)
+    image_url = models.CharField(max_length=500, blank=True, editable=False, verbose_name="URL зображення")
+    video_file_url = models.CharField(max_length=500, blank=True, editable=False, verbose_name="URL відео")
+    # Розмита мініатюра (data URI) та основний колір зображення (services/image_processing.py)
+    image_placeholder = models.TextField(blank=True, editable=False, verbose_name="Заглушка зображення")
+    image_color = models.CharField(max_length=7, blank=True, editable=False, verbose_name="Основний колір зображення")
     
     # Метадані
     meta_title = models.CharField(max_length=200, blank=True, verbose_name="Meta заголовок")
@@ -156,6 +172,8 @@ class Article(models.Model):
     # Статистика
     reading_time = models.IntegerField(default=0, verbose_name="Час читання (хв)")
     views_count = models.IntegerField(default=0, verbose_name="Переглядів")
+    # Перегляди з експоненційним згасанням у часі (services/trending.py)
+    trending_score = models.FloatField(default=0, verbose_name="Популярність зараз")
     
     # Статус
     is_featured = models.BooleanField(default=False, verbose_name="Рекомендована")
@@ -174,6 +192,7 @@ class Article(models.Model):
             models.Index(fields=['-published_at', 'status']),
             models.Index(fields=['category', 'status']),
             models.Index(fields=['is_featured', 'status']),
+            models.Index(fields=['status', '-trending_score']),
         ]
 
     def __str__(self):
@@ -188,92 +207,243 @@ class Article(models.Model):
         
         # Автоматичний розрахунок часу читання
         if self.content:
-            word_count = len(self.content.split())
-            self.reading_time = max(1, math.ceil(word_count / 200))  # ~200 слів на хвилину
+            self.reading_time = self.estimate_reading_time(self.content)
         
         # Встановлення дати публікації
         if self.status == 'published' and not self.published_at:
             self.published_at = timezone.now()
         
+        # Нове зображення оптимізується до збереження в storage
+        if self.featured_image and not self.featured_image._committed:
+            self.process_featured_image()
+        elif not self.featured_image:
+            self.image_placeholder = self.image_color = ''
+        
+        # Нові файли зберігаються в storage тут (а не пізніше в pre_save поля),
+        # щоб URL обчислювались від остаточних імен
+        for field_name in MEDIA_DERIVED_FIELDS:
+            self._meta.get_field(field_name).pre_save(self, self._state.adding)
+        self.update_media_urls()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = set(update_fields) | {
+                derived
+                for field_name, derived_fields in MEDIA_DERIVED_FIELDS.items() if field_name in update_fields
+                for derived in derived_fields
+            }
+        
         super().save(*args, **kwargs)
 
+    def process_featured_image(self):
+        """Прибрати EXIF, обмежити розмір, перестиснути та обчислити заглушку"""
+        from services.image_processing import process_image
+        processed = process_image(self.featured_image.file)
+        if processed.content is not self.featured_image.file:
+            self.featured_image.file = processed.content
+            self.featured_image.name = processed.content.name
+        self.image_placeholder = processed.placeholder
+        self.image_color = processed.color
+
+    def update_media_urls(self):
+        """Заповнити image_url та video_file_url з імен файлів"""
+        self.image_url = resolve_image_url(self.featured_image.name) if self.featured_image else ''
+        self.video_file_url = resolve_video_url(self.featured_video.name) if self.featured_video else ''
+
+    @staticmethod
+    def estimate_reading_time(content):
+        """Час читання в хвилинах (~200 слів на хвилину)"""
+        return max(1, math.ceil(len(content.split()) / 200))
+
     def increment_views(self):
-        """Збільшити кількість переглядів"""
+        """Збільшити кількість переглядів (атомарно в БД)"""
+        Article.objects.filter(pk=self.pk).update(views_count=models.F('views_count') + 1)
         self.views_count += 1
-        self.save(update_fields=['views_count'])
     
     def get_featured_image_url(self):
         """Повертає правильний URL для зображення з Cloudinary"""
         if not self.featured_image:
             return None
-        
-        image_url = self.featured_image.url
-        
-        # Якщо це Cloudinary URL, переконуємося, що він правильний
-        if 'res.cloudinary.com' in image_url:
-            # Cloudinary для зображень повертає URL у форматі:
-            # https://res.cloudinary.com/cloud_name/image/upload/v1234567890/path/to/image.jpg
-            # Перевіряємо, чи URL містить /image/upload/
-            if '/image/upload/' in image_url:
-                # URL вже правильний для зображення
-                return image_url
-            elif '/video/upload/' in image_url:
-                # Якщо зображення було завантажено як video (помилка), виправляємо на image
-                image_url = image_url.replace('/video/upload/', '/image/upload/')
-                return image_url
-            else:
-                # Якщо URL не містить /image/upload/, генеруємо правильний URL
-                try:
-                    import cloudinary
-                    # Отримуємо public_id з URL або з поля
-                    public_id = self.featured_image.name
-                    # Генеруємо правильний URL для зображення
-                    image_url = cloudinary.utils.cloudinary_url(public_id, resource_type='image')[0]
-                    return image_url
-                except Exception:
-                    # Якщо не вдалося, повертаємо оригінальний URL
-                    return image_url
-        
-        return image_url
+        return self.image_url or resolve_image_url(self.featured_image.name)
     
     def get_video_file_url(self):
         """Повертає правильний URL для відео файлу з Cloudinary"""
         if not self.featured_video:
             return None
-        
-        video_url = self.featured_video.url
-        
-        # Якщо це Cloudinary URL для відео, переконуємося, що він правильний
-        if 'res.cloudinary.com' in video_url:
-            # Cloudinary для відео повертає URL у форматі:
-            # https://res.cloudinary.com/cloud_name/video/upload/v1234567890/path/to/video.mp4
-            # Або з public_id:
-            # https://res.cloudinary.com/cloud_name/video/upload/public_id
-            
-            # Перевіряємо, чи URL містить /video/upload/
-            if '/video/upload/' in video_url:
-                # URL вже правильний для відео
+        return self.video_file_url or resolve_video_url(self.featured_video.name)
+
+
+@lru_cache(maxsize=MEDIA_URL_CACHE_SIZE)
+def resolve_image_url(name):
+    """URL зображення за ім'ям файлу в storage (залежить лише від імені, тому кешується)"""
+    image_url = Article._meta.get_field('featured_image').storage.url(name)
+
+    # Якщо це Cloudinary URL, переконуємося, що він правильний
+    if 'res.cloudinary.com' in image_url:
+        # Cloudinary для зображень повертає URL у форматі:
+        # https://res.cloudinary.com/cloud_name/image/upload/v1234567890/path/to/image.jpg
+        # Перевіряємо, чи URL містить /image/upload/
+        if '/image/upload/' in image_url:
+            # URL вже правильний для зображення
+            return image_url
+        elif '/video/upload/' in image_url:
+            # Якщо зображення було завантажено як video (помилка), виправляємо на image
+            image_url = image_url.replace('/video/upload/', '/image/upload/')
+            return image_url
+        else:
+            # Якщо URL не містить /image/upload/, генеруємо правильний URL
+            try:
+                import cloudinary
+                # Отримуємо public_id з URL або з поля
+                public_id = name
+                # Генеруємо правильний URL для зображення
+                image_url = cloudinary.utils.cloudinary_url(public_id, resource_type='image')[0]
+                return image_url
+            except Exception:
+                # Якщо не вдалося, повертаємо оригінальний URL
+                return image_url
+
+    return image_url
+
+
+@lru_cache(maxsize=MEDIA_URL_CACHE_SIZE)
+def resolve_video_url(name):
+    """URL відео за ім'ям файлу в storage (залежить лише від імені, тому кешується)"""
+    video_url = Article._meta.get_field('featured_video').storage.url(name)
+
+    # Якщо це Cloudinary URL для відео, переконуємося, що він правильний
+    if 'res.cloudinary.com' in video_url:
+        # Cloudinary для відео повертає URL у форматі:
+        # https://res.cloudinary.com/cloud_name/video/upload/v1234567890/path/to/video.mp4
+        # Або з public_id:
+        # https://res.cloudinary.com/cloud_name/video/upload/public_id
+
+        # Перевіряємо, чи URL містить /video/upload/
+        if '/video/upload/' in video_url:
+            # URL вже правильний для відео
+            return video_url
+        elif '/image/upload/' in video_url:
+            # Якщо відео було завантажено як image (помилка), виправляємо на video
+            video_url = video_url.replace('/image/upload/', '/video/upload/')
+            return video_url
+        else:
+            # Якщо URL не містить /video/upload/, генеруємо правильний URL
+            # Використовуємо Cloudinary API для генерації правильного URL
+            try:
+                import cloudinary
+                # Отримуємо public_id з URL або з поля
+                public_id = name
+                # Генеруємо правильний URL для відео
+                video_url = cloudinary.utils.cloudinary_url(public_id, resource_type='video')[0]
                 return video_url
-            elif '/image/upload/' in video_url:
-                # Якщо відео було завантажено як image (помилка), виправляємо на video
-                video_url = video_url.replace('/image/upload/', '/video/upload/')
+            except Exception:
+                # Якщо не вдалося, повертаємо оригінальний URL
                 return video_url
-            else:
-                # Якщо URL не містить /video/upload/, генеруємо правильний URL
-                # Використовуємо Cloudinary API для генерації правильного URL
-                try:
-                    import cloudinary
-                    # Отримуємо public_id з URL або з поля
-                    public_id = self.featured_video.name
-                    # Генеруємо правильний URL для відео
-                    video_url = cloudinary.utils.cloudinary_url(public_id, resource_type='video')[0]
-                    return video_url
-                except Exception:
-                    # Якщо не вдалося, повертаємо оригінальний URL
-                    return video_url
-        
-        return video_url
-    
+
+    return video_url
+
+
+class RelatedArticle(models.Model):
+    """
+    Схожа стаття з готовою оцінкою схожості.
+    Таблиця перераховується services/related.py при зміні тегів/категорії статей.
+    """
+    article = models.ForeignKey(Article, on_delete=models.CASCADE, related_name='related_links', verbose_name="Стаття")
+    related = models.ForeignKey(Article, on_delete=models.CASCADE, related_name='+', verbose_name="Схожа стаття")
+    score = models.FloatField(verbose_name="Оцінка схожості")
+
+    class Meta:
+        verbose_name = "Схожа стаття"
+        verbose_name_plural = "Схожі статті"
+        ordering = ['article', '-score']
+        constraints = [
+            models.UniqueConstraint(fields=['article', 'related'], name='unique_related_article'),
+        ]
+        indexes = [
+            models.Index(fields=['article', '-score']),
+        ]
+
+    def __str__(self):
+        return f"{self.article_id} → {self.related_id} ({self.score:.3f})"
+
+
+class ArticleViewStat(models.Model):
+    """Кількість переглядів статті за день"""
+    article = models.ForeignKey(Article, on_delete=models.CASCADE, related_name='view_stats', verbose_name="Стаття")
+    date = models.DateField(verbose_name="Дата")
+    views = models.PositiveIntegerField(default=0, verbose_name="Переглядів")
+    # Скетч HyperLogLog унікальних читачів за день (services/hll.py)
+    readers = models.BinaryField(null=True, blank=True, verbose_name="Унікальні читачі (скетч)")
+
+    class Meta:
+        verbose_name = "Статистика переглядів"
+        verbose_name_plural = "Статистика переглядів"
+        ordering = ['-date']
+        constraints = [
+            models.UniqueConstraint(fields=['article', 'date'], name='unique_article_view_stat'),
+        ]
+        indexes = [
+            models.Index(fields=['date']),
+        ]
+
+    def __str__(self):
+        return f"{self.article_id} {self.date}: {self.views}"
+
+
+class MediaAsset(models.Model):
+    """
+    Завантажений у storage файл, адресований вмістом.
+    Один запис на пару (sha256, URL джерела): однакові байти з різних URL
+    посилаються на той самий збережений файл.
+    """
+    sha256 = models.CharField(max_length=64, verbose_name="SHA-256")
+    source_url = models.URLField(max_length=500, blank=True, db_index=True, verbose_name="URL джерела")
+    name = models.CharField(max_length=255, verbose_name="Ім'я в storage")
+    size = models.PositiveIntegerField(default=0, verbose_name="Розмір (байт)")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Медіафайл"
+        verbose_name_plural = "Медіафайли"
+        ordering = ['-created_at']
+        constraints = [
+            models.UniqueConstraint(fields=['sha256', 'source_url'], name='unique_media_asset_source'),
+        ]
+
+    def __str__(self):
+        return self.name
+
+
+class VideoUpload(models.Model):
+    """Відновлюване завантаження відео частинами (services/uploads.py)"""
+    STATUS_UPLOADING = 'uploading'
+    STATUS_PROCESSING = 'processing'
+    STATUS_COMPLETE = 'complete'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_UPLOADING, 'Завантажується'),
+        (STATUS_PROCESSING, 'Зберігається в storage'),
+        (STATUS_COMPLETE, 'Завершено'),
+        (STATUS_FAILED, 'Помилка'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    filename = models.CharField(max_length=255, verbose_name="Ім'я файлу")
+    size = models.BigIntegerField(verbose_name="Розмір (байт)")
+    offset = models.BigIntegerField(default=0, verbose_name="Отримано (байт)")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_UPLOADING, verbose_name="Статус")
+    asset_name = models.CharField(max_length=255, blank=True, verbose_name="Ім'я в storage")
+    error = models.TextField(blank=True, verbose_name="Помилка")
+    created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='+', verbose_name="Користувач")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Завантаження відео"
+        verbose_name_plural = "Завантаження відео"
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.filename} ({self.offset}/{self.size})"
 
 
 class NewsletterSubscriber(models.Model):
@@ -0,0 +1,66 @@
+"""
+Сигнали для інвалідації кешу, оновлення пошукового індексу
+та схожих статей при зміні контенту
+"""
+from django.db import transaction
+from django.db.models.signals import post_save, pre_delete, post_delete, m2m_changed
+from django.dispatch import receiver
+from articles.models import Article, Category, Tag, RelatedArticle
+from services.cache import ARTICLE_NAMESPACES, NAVIGATION, bump_on_commit
+from services.search import get_search_backend
+from services.related import RelatedArticleService
+
+# Поля, зміна яких не впливає на закешовані списки
+NON_CONTENT_FIELDS = frozenset({'views_count'})
+
+
+def _is_content_change(update_fields):
+    return not update_fields or not set(update_fields) <= NON_CONTENT_FIELDS
+
+
+@receiver(post_save, sender=Article)
+def article_saved(sender, instance, update_fields=None, **kwargs):
+    """Збереження статті інвалідує всі списки статей"""
+    if _is_content_change(update_fields):
+        bump_on_commit(*ARTICLE_NAMESPACES)
+        transaction.on_commit(lambda: get_search_backend().index_articles([instance]))
+        RelatedArticleService.update_on_commit(instance.id)
+
+
+@receiver(pre_delete, sender=Article)
+def article_deleting(sender, instance, **kwargs):
+    """Статті, що посилались на видалену, перераховують свої схожі"""
+    referrers = RelatedArticle.objects.filter(related=instance).values_list('article_id', flat=True)
+    RelatedArticleService.update_on_commit(*referrers)
+
+
+@receiver(post_delete, sender=Article)
+def article_deleted(sender, instance, **kwargs):
+    bump_on_commit(*ARTICLE_NAMESPACES)
+    article_id = instance.id
+    transaction.on_commit(lambda: get_search_backend().remove([article_id]))
+
+
+@receiver(m2m_changed, sender=Article.tags.through)
+def article_tags_changed(sender, instance, action, **kwargs):
+    """Теги показуються в картках, тому їх зміна теж інвалідує списки"""
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        bump_on_commit(*ARTICLE_NAMESPACES)
+        if isinstance(instance, Article):
+            RelatedArticleService.update_on_commit(instance.id)
+        else:
+            # Зміна з боку тегу (tag.articles.add(...))
+            RelatedArticleService.update_on_commit(*(kwargs.get('pk_set') or ()))
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def category_changed(sender, instance, **kwargs):
+    # Назва та slug категорії є в кожній картці статті та в навігації
+    bump_on_commit(*ARTICLE_NAMESPACES, NAVIGATION)
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def tag_changed(sender, instance, **kwargs):
+    bump_on_commit(*ARTICLE_NAMESPACES)
@@ -1,16 +1,50 @@
 from django.contrib.sitemaps import Sitemap
-from .models import Article, Category, Tag
+from django.db.models import Max
+from django.urls import reverse
+from .models import Article, Category, Tag, resolve_image_url
+
+# Максимальна кількість URL в одному дочірньому sitemap
+ARTICLES_PER_SITEMAP = 5000
 
 
 class ArticleSitemap(Sitemap):
+    """
+    Статті: вибираються лише slug, updated_at та зображення (без контенту),
+    по ARTICLES_PER_SITEMAP на сторінку індексу (sitemap-articles.xml?p=N)
+    """
     changefreq = 'weekly'
     priority = 0.8
+    limit = ARTICLES_PER_SITEMAP
 
     def items(self):
-        return Article.objects.filter(status='published')
+        return Article.objects.filter(status='published').order_by('-published_at', 'id').values(
+            'slug', 'updated_at', 'featured_image', 'image_url'
+        )
+
+    def location(self, item):
+        return reverse('articles:article_detail', kwargs={'slug': item['slug']})
+
+    def lastmod(self, item):
+        return item['updated_at']
 
-    def lastmod(self, obj):
-        return obj.updated_at
+    def get_latest_lastmod(self):
+        return Article.objects.filter(status='published').aggregate(latest=Max('updated_at'))['latest']
+
+    def image(self, item):
+        """URL головного зображення для <image:image>"""
+        name = item['featured_image']
+        if not name:
+            return None
+        try:
+            return item['image_url'] or resolve_image_url(name)
+        except Exception:
+            return None
+
+    def get_urls(self, page=1, site=None, protocol=None):
+        urls = super().get_urls(page=page, site=site, protocol=protocol)
+        for url in urls:
+            url['image'] = self.image(url['item'])
+        return urls
 
 
 class CategorySitemap(Sitemap):
@@ -28,3 +62,9 @@ class TagSitemap(Sitemap):
     def items(self):
         return Tag.objects.all()
 
+
+sitemaps = {
+    'articles': ArticleSitemap,
+    'categories': CategorySitemap,
+    'tags': TagSitemap,
+}
@@ -4,16 +4,81 @@
 from cloudinary_storage.storage import MediaCloudinaryStorage
 import mimetypes
 import os
+import time
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Розмір частини при завантаженні відео (Cloudinary приймає частини від 5 МБ)
+VIDEO_CHUNK_SIZE = 6 * 1024 * 1024
+CHUNK_RETRIES = 3
+CHUNK_RETRY_DELAY = 1.0  # секунди, подвоюється з кожною спробою
 
-class VideoCloudinaryStorage(MediaCloudinaryStorage):
+
+class ContentAddressedStorageMixin:
+    """
+    Дедуплікація за вмістом: файл з уже завантаженими байтами (sha256)
+    не завантажується повторно, а повертається ім'я наявного ресурсу
+    (див. services/media.py)
+    """
+    def save(self, name, content, max_length=None):
+        from services.media import MediaAssetService
+        return MediaAssetService.save(self, name, content, max_length, super().save)
+
+
+class VideoCloudinaryStorage(ContentAddressedStorageMixin, MediaCloudinaryStorage):
     """
     Storage для файлів на Cloudinary.
     Автоматично визначає відео файли за шляхом або типом і встановлює resource_type='video'
     """
+    def upload_part(self, part, http_headers, options):
+        """Завантажити одну частину (окремий метод, щоб його можна було підмінити)"""
+        import cloudinary.uploader
+        return cloudinary.uploader.upload_large_part(part, http_headers=http_headers, **options)
+
+    def upload_in_chunks(self, content, options, chunk_size=VIDEO_CHUNK_SIZE):
+        """
+        Завантажити файл частинами по chunk_size байт (Content-Range з одним
+        X-Unique-Upload-Id), повторюючи лише частину, що не вдалася.
+        Повертає відповідь Cloudinary на останню частину.
+        """
+        import cloudinary.utils
+        from cloudinary.exceptions import AlreadyExists, AuthorizationRequired, BadRequest, NotAllowed, NotFound
+        # Помилки запиту, які повтор не виправить
+        fatal = (AlreadyExists, AuthorizationRequired, BadRequest, NotAllowed, NotFound)
+        
+        size = content.size
+        filename = os.path.basename(content.name or 'stream')
+        upload_id = cloudinary.utils.random_public_id()
+        content.seek(0)
+        offset = 0
+        response = None
+        while True:
+            chunk = content.read(chunk_size)
+            if not chunk:
+                break
+            http_headers = {
+                'Content-Range': f'bytes {offset}-{offset + len(chunk) - 1}/{size}',
+                'X-Unique-Upload-Id': upload_id,
+            }
+            for attempt in range(1, CHUNK_RETRIES + 1):
+                try:
+                    response = self.upload_part((filename, chunk), http_headers, options)
+                    break
+                except fatal:
+                    raise
+                except Exception as e:
+                    if attempt == CHUNK_RETRIES:
+                        raise
+                    logger.warning(f"Повтор частини {http_headers['Content-Range']} ({attempt}/{CHUNK_RETRIES}): {e}")
+                    time.sleep(CHUNK_RETRY_DELAY * 2 ** (attempt - 1))
+            # Наступні частини дописуються до того ж ресурсу
+            options = {**options, 'public_id': response.get('public_id')}
+            offset += len(chunk)
+        if response is None:
+            raise ValueError('Порожній файл відео')
+        return response
+
     def _save(self, name, content):
         """
         Зберігає файл на Cloudinary, автоматично визначаючи тип
@@ -75,24 +140,15 @@ class VideoCloudinaryStorage(MediaCloudinaryStorage):
                 logger.error(f"CLOUDINARY_URL: {cloudinary_url[:30]}...")
                 raise
             
-            # Використовуємо Cloudinary API напряму для завантаження відео
+            # Завантажуємо частинами з файлу (великі завантаження Django вже
+            # тримає на диску), тому в пам'яті одночасно лише одна частина
             options = {
                 'resource_type': 'video',
                 'folder': 'articles/videos/',
             }
-            # Перевіряємо, чи content має метод read
-            if hasattr(content, 'read'):
-                # Якщо це файловий об'єкт, читаємо його
-                content.seek(0)  # Повертаємося на початок файлу
-                file_data = content.read()
-                logger.info(f"Завантаження відео на Cloudinary: {name}, розмір: {len(file_data)} байт")
-                response = cloudinary.uploader.upload(file_data, **options)
-                logger.info(f"✓ Відео завантажено на Cloudinary: {response.get('public_id', 'unknown')}")
-            else:
-                # Якщо це вже дані, використовуємо напряму
-                logger.info(f"Завантаження відео на Cloudinary: {name}")
-                response = cloudinary.uploader.upload(content, **options)
-                logger.info(f"✓ Відео завантажено на Cloudinary: {response.get('public_id', 'unknown')}")
+            logger.info(f"Завантаження відео на Cloudinary: {name}, розмір: {content.size} байт")
+            response = self.upload_in_chunks(content, options)
+            logger.info(f"✓ Відео завантажено на Cloudinary: {response.get('public_id', 'unknown')}")
             
             # Повертаємо public_id як ім'я файлу
             # Cloudinary повертає public_id у форматі: folder/public_id або просто public_id
@@ -131,3 +187,6 @@ class VideoCloudinaryStorage(MediaCloudinaryStorage):
             # Для інших файлів використовуємо стандартний метод
             return super().url(name)
 
+
+class DeduplicatedMediaCloudinaryStorage(ContentAddressedStorageMixin, MediaCloudinaryStorage):
+    """Storage для зображень з дедуплікацією за вмістом"""
@@ -0,0 +1,26 @@
+"""
+Тег адаптивного зображення
+
+{% load responsive_images %}
+{% responsive_image article.image_url 'card' alt=article.title placeholder=article.image_placeholder color=article.image_color %}
+"""
+from django import template
+from services.responsive_images import responsive_image as build_responsive_image
+
+register = template.Library()
+
+
+@register.inclusion_tag('articles/includes/responsive_image.html')
+def responsive_image(url, preset, alt='', loading='lazy', css_class='', placeholder='', color=''):
+    """
+    <img> з srcset, sizes та явними width/height (пресети - services/responsive_images.py).
+    placeholder/color - LQIP-заглушка та основний колір, що показуються фоном до завантаження.
+    """
+    return {
+        'image': build_responsive_image(url, preset),
+        'alt': alt,
+        'loading': loading,
+        'css_class': css_class,
+        'placeholder': placeholder,
+        'color': color,
+    }
@@ -12,5 +12,7 @@ urlpatterns = [
     path('authors/<str:username>/', views.author_detail, name='author_detail'),
     path('search/', views.search, name='search'),
     path('api/live-search/', views.live_search, name='live_search'),
+    path('api/uploads/videos/', views.video_upload_create, name='video_upload_create'),
+    path('api/uploads/videos/<uuid:upload_id>/', views.video_upload, name='video_upload'),
 ]
 
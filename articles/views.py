@@ -1,54 +1,41 @@
+import json
+import hashlib
+from functools import wraps
 from django.shortcuts import render, get_object_or_404
-from django.core.paginator import Paginator
-from django.db.models import Q
-from django.http import JsonResponse, Http404
+from django.urls import reverse
+from django.http import HttpResponse, JsonResponse, Http404
+from django.contrib.sitemaps import views as sitemap_views
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import parse_http_date_safe
 from django.views.decorators.http import require_http_methods
 from services.article_service import ArticleService
-from articles.models import Article, Category, Tag
+from services.home_service import HomePageService
+from services.live_search import live_search_index
+from services.readers import UniqueReaderService, visitor_id
+from services.cache import SITEMAP, make_key, get_or_compute
+from services.uploads import ResumableUploadService, UploadError, OffsetMismatch
+from articles.models import VideoUpload
+from articles.sitemaps import sitemaps
 
-
-def get_categories_for_context():
-    """Отримати категорії для контексту (замість context_processors)"""
-    try:
-        return Category.objects.filter(is_active=True).order_by('order', 'name')
-    except Exception:
-        return []
+# Sitemap інвалідується при зміні статей, тому може жити довго
+SITEMAP_CACHE_TIMEOUT = 60 * 60 * 24  # 1 день
 
 
 def home(request):
     """Головна сторінка з різними блоками контенту"""
-    featured_articles = ArticleService.get_featured_articles(limit=1)
-    latest_news = ArticleService.get_latest_articles(limit=6)
-    popular_articles = ArticleService.get_popular_articles(limit=6, days=30)
-    
-    # Отримати статті за категоріями
-    interviews = ArticleService.get_latest_articles(limit=4, category_slug='interviews')
-    reviews = ArticleService.get_latest_articles(limit=4, category_slug='reviews')
-    
-    context = {
-        'featured_article': featured_articles[0] if featured_articles else None,
-        'latest_news': latest_news,
-        'popular_articles': popular_articles,
-        'interviews': interviews,
-        'reviews': reviews,
-        'categories': get_categories_for_context(),  # Додаємо категорії для навігації
-    }
+    context = HomePageService.load()
     return render(request, 'articles/home.html', context)
 
 
 def article_list(request):
     """Список всіх статей з пагінацією"""
-    articles = Article.objects.filter(
-        status='published'
-    ).select_related('author', 'category').prefetch_related('tags')
-    
-    paginator = Paginator(articles, 12)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    page_obj = ArticleService.get_articles_page(
+        page=request.GET.get('page'),
+        cursor=request.GET.get('cursor'),
+    )
     
     context = {
         'page_obj': page_obj,
-        'categories': get_categories_for_context(),
     }
     return render(request, 'articles/article_list.html', context)
 
@@ -61,7 +48,7 @@ def article_detail(request, slug):
         raise Http404("Статтю не знайдено")
     
     # Збільшити кількість переглядів
-    ArticleService.increment_views(article)
+    ArticleService.increment_views(article, visitor=visitor_id(request))
     
     # Отримати схожі статті
     related_articles = ArticleService.get_related_articles(article, limit=4)
@@ -69,15 +56,16 @@ def article_detail(request, slug):
     context = {
         'article': article,
         'related_articles': related_articles,
-        'categories': get_categories_for_context(),
+        'unique_readers': UniqueReaderService.get_reader_stats(article.id),
     }
     return render(request, 'articles/article_detail.html', context)
 
 
 def category_detail(request, slug):
     """Сторінка категорії зі статтями"""
-    page_number = request.GET.get('page', 1)
-    page_obj, category = ArticleService.get_articles_by_category(slug, page=page_number)
+    page_obj, category = ArticleService.get_articles_by_category(
+        slug, page=request.GET.get('page'), cursor=request.GET.get('cursor')
+    )
     
     if not category:
         raise Http404("Категорію не знайдено")
@@ -85,15 +73,15 @@ def category_detail(request, slug):
     context = {
         'category': category,
         'page_obj': page_obj,
-        'categories': get_categories_for_context(),
     }
     return render(request, 'articles/category_detail.html', context)
 
 
 def tag_detail(request, slug):
     """Сторінка тегу зі статтями"""
-    page_number = request.GET.get('page', 1)
-    page_obj, tag = ArticleService.get_articles_by_tag(slug, page=page_number)
+    page_obj, tag = ArticleService.get_articles_by_tag(
+        slug, page=request.GET.get('page'), cursor=request.GET.get('cursor')
+    )
     
     if not tag:
         raise Http404("Тег не знайдено")
@@ -101,15 +89,15 @@ def tag_detail(request, slug):
     context = {
         'tag': tag,
         'page_obj': page_obj,
-        'categories': get_categories_for_context(),
     }
     return render(request, 'articles/tag_detail.html', context)
 
 
 def author_detail(request, username):
     """Сторінка автора зі статтями"""
-    page_number = request.GET.get('page', 1)
-    page_obj, author = ArticleService.get_articles_by_author(username, page=page_number)
+    page_obj, author = ArticleService.get_articles_by_author(
+        username, page=request.GET.get('page'), cursor=request.GET.get('cursor')
+    )
     
     if not author:
         raise Http404("Автора не знайдено")
@@ -117,7 +105,6 @@ def author_detail(request, username):
     context = {
         'author': author,
         'page_obj': page_obj,
-        'categories': get_categories_for_context(),
     }
     return render(request, 'articles/author_detail.html', context)
 
@@ -125,17 +112,15 @@ def author_detail(request, username):
 def search(request):
     """Пошук статей"""
     query = request.GET.get('q', '').strip()
-    page_number = request.GET.get('page', 1)
     
     if query:
-        page_obj = ArticleService.search_articles(query, page=page_number)
+        page_obj = ArticleService.search_articles(query, page=request.GET.get('page'))
     else:
         page_obj = None
     
     context = {
         'query': query,
         'page_obj': page_obj,
-        'categories': get_categories_for_context(),
     }
     return render(request, 'articles/search.html', context)
 
@@ -148,19 +133,59 @@ def live_search(request):
     if len(query) < 2:
         return JsonResponse({'results': []})
     
-    articles = Article.objects.filter(
-        Q(title__icontains=query) | Q(short_description__icontains=query),
-        status='published'
-    ).select_related('author', 'category')[:5]
-    
-    results = [{
-        'title': article.title,
-        'url': article.get_absolute_url(),
-        'short_description': article.short_description[:100] + '...' if len(article.short_description) > 100 else article.short_description,
-        'category': article.category.name if article.category else '',
-    } for article in articles]
-    
-    return JsonResponse({'results': results})
+    return JsonResponse({'results': live_search_index.search(query)})
+
+
+def _cached_sitemap_response(request, render, *key_parts):
+    """
+    Віддати згенерований sitemap з кешу (інвалідується при зміні статей)
+    з ETag та Last-Modified, щоб краулери отримували 304 без перегенерації
+    """
+    def compute():
+        response = render()
+        response.render()
+        return response.content, response.headers.get('Last-Modified')
+
+    cache_key = make_key(SITEMAP, request.scheme, request.get_host(), *key_parts)
+    content, last_modified = get_or_compute(cache_key, compute, SITEMAP_CACHE_TIMEOUT)
+
+    etag = quote_etag(hashlib.md5(content).hexdigest())
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=parse_http_date_safe(last_modified) if last_modified else None,
+    )
+    if response is None:
+        response = HttpResponse(content, content_type='application/xml')
+    response['ETag'] = etag
+    if last_modified:
+        response['Last-Modified'] = last_modified
+    response['X-Robots-Tag'] = 'noindex, noodp, noarchive'
+    return response
+
+
+@require_http_methods(["GET", "HEAD"])
+def sitemap_index(request):
+    """Індекс sitemap з посиланнями на сторінки розділів"""
+    return _cached_sitemap_response(
+        request,
+        lambda: sitemap_views.index(request, sitemaps, sitemap_url_name='sitemap_section'),
+        'index',
+    )
+
+
+@require_http_methods(["GET", "HEAD"])
+def sitemap_section(request, section):
+    """Сторінка sitemap розділу (?p=N для великих розділів)"""
+    if section not in sitemaps:
+        raise Http404("Розділ sitemap не знайдено")
+    page = request.GET.get('p', '1')
+    return _cached_sitemap_response(
+        request,
+        lambda: sitemap_views.sitemap(request, sitemaps, section=section, template_name='sitemap_images.xml'),
+        section,
+        page,
+    )
 
 
 def handler404(request, exception):
@@ -196,3 +221,77 @@ def handler500(request):
     except Exception:
         html = """<!DOCTYPE html><html><head><meta charset="utf-8"><title>500</title></head><body><h1>500</h1><p>Помилка сервера</p><a href="/">На головну</a></body></html>"""
         return HttpResponseServerError(html, content_type='text/html; charset=utf-8')
+
+
+# ---------- Відновлювані завантаження відео (services/uploads.py) ----------
+
+def staff_api(view):
+    """Доступ лише для персоналу адмінки; відповідь JSON замість редиректу на логін"""
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if not (request.user.is_active and request.user.is_staff):
+            return JsonResponse({'error': 'Доступ заборонено'}, status=403)
+        return view(request, *args, **kwargs)
+    return wrapper
+
+
+def _upload_state(upload, status=200):
+    response = JsonResponse({
+        'id': str(upload.pk),
+        'filename': upload.filename,
+        'size': upload.size,
+        'offset': upload.offset,
+        'status': upload.status,
+        'error': upload.error,
+    }, status=status)
+    response['Upload-Offset'] = upload.offset
+    response['Upload-Length'] = upload.size
+    response['Cache-Control'] = 'no-store'
+    return response
+
+
+@require_http_methods(["POST"])
+@staff_api
+def video_upload_create(request):
+    """Створити сесію завантаження: {"filename": ..., "size": ...}"""
+    try:
+        data = json.loads(request.body)
+        upload = ResumableUploadService.create(request.user, data.get('filename'), data.get('size'))
+    except (ValueError, AttributeError):
+        return JsonResponse({'error': 'Некоректний запит'}, status=400)
+    except UploadError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    response = _upload_state(upload, status=201)
+    response['Location'] = reverse('articles:video_upload', args=[upload.pk])
+    return response
+
+
+@require_http_methods(["GET", "HEAD", "PATCH", "DELETE"])
+@staff_api
+def video_upload(request, upload_id):
+    """
+    GET/HEAD - поточне зміщення та статус;
+    PATCH - наступна частина файлу (заголовок Upload-Offset, тіло - байти частини);
+    DELETE - скасувати завантаження
+    """
+    upload = get_object_or_404(VideoUpload, pk=upload_id)
+    if request.method == 'DELETE':
+        ResumableUploadService.abort(upload.pk)
+        return HttpResponse(status=204)
+    if request.method != 'PATCH':
+        return _upload_state(upload)
+
+    try:
+        offset = int(request.headers['Upload-Offset'])
+        length = int(request.headers['Content-Length'])
+    except (KeyError, ValueError):
+        return JsonResponse({'error': 'Потрібні заголовки Upload-Offset та Content-Length'}, status=400)
+    try:
+        # Тіло читається потоком прямо у тимчасовий файл, без request.body
+        upload = ResumableUploadService.append(upload.pk, offset, request, length)
+    except OffsetMismatch as e:
+        upload.offset = e.offset
+        return _upload_state(upload, status=409)
+    except UploadError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    return _upload_state(upload)
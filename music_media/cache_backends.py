@@ -0,0 +1,297 @@
+"""
+Дворівневий кеш: L1 у пам'яті воркера + спільний L2
+
+L1 - обмежений LRU в процесі gunicorn-воркера (без мережі та десеріалізації з диска).
+L2 - спільне сховище для всіх воркерів (Redis у production, файловий кеш локально).
+
+Кожен запис у L2 (set/delete/incr/clear) транслюється іншим воркерам через
+журнал інвалідацій у самому L2: лічильник послідовності + список ключів
+для кожного номера. Воркери перевіряють журнал не частіше ніж раз на
+INVALIDATION_POLL_INTERVAL секунд і викидають змінені ключі зі свого L1.
+
+Налаштування (CACHES[...]['OPTIONS']):
+    L2_CACHE - аліас спільного кешу (за замовчуванням 'shared')
+    L1_MAX_ENTRIES - максимальна кількість записів в L1
+    L1_MAX_AGE - максимальний час життя запису в L1, секунд
+    INVALIDATION_POLL_INTERVAL - як часто читати журнал інвалідацій, секунд
+"""
+import time
+import pickle
+import logging
+import threading
+from collections import OrderedDict
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache, DEFAULT_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+SEQ_KEY = '__l1:seq'
+EVENT_KEY = '__l1:event:{}'
+STATS_KEY = '__l1:stats:{}'
+# Скільки живе запис журналу інвалідацій у L2
+EVENT_TIMEOUT = 300
+# Якщо воркер відстав більше ніж на стільки подій - просто очищаємо L1
+MAX_EVENTS_BEHIND = 256
+# Маркер очищення всього кешу
+CLEAR_ALL = '*'
+# Як часто зливати лічильники влучань у L2 для команди cache_stats
+STATS_FLUSH_INTERVAL = 60
+STAT_NAMES = ('l1_hits', 'l2_hits', 'misses')
+
+
+class TwoTierCache(BaseCache):
+    """Кеш-бекенд з локальним LRU (L1) перед спільним кешем (L2)"""
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        self._l2_alias = options.get('L2_CACHE', 'shared')
+        self._l1_max_entries = int(options.get('L1_MAX_ENTRIES', 1000))
+        self._l1_max_age = float(options.get('L1_MAX_AGE', 60))
+        self._poll_interval = float(options.get('INVALIDATION_POLL_INTERVAL', 0.5))
+
+        self._l1 = OrderedDict()  # key -> (expires_at, pickled value)
+        self._lock = threading.Lock()
+        self._seen_seq = None
+        self._last_poll = 0.0
+        self._stats = dict.fromkeys(STAT_NAMES, 0)
+        self._unflushed_stats = dict.fromkeys(STAT_NAMES, 0)
+        self._last_stats_flush = time.time()
+
+    @property
+    def l2(self):
+        return caches[self._l2_alias]
+
+    # ---------- L1 ----------
+
+    def _l1_get(self, key):
+        with self._lock:
+            entry = self._l1.get(key)
+            if entry is None:
+                return self._missing_key
+            expires_at, data = entry
+            if expires_at <= time.time():
+                del self._l1[key]
+                return self._missing_key
+            self._l1.move_to_end(key)
+        return pickle.loads(data)
+
+    def _l1_set(self, key, value, timeout):
+        if timeout is not None and timeout <= 0:
+            self._l1_delete([key])
+            return
+        max_age = self._l1_max_age if timeout is None else min(timeout, self._l1_max_age)
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._l1[key] = (time.time() + max_age, data)
+            self._l1.move_to_end(key)
+            while len(self._l1) > self._l1_max_entries:
+                self._l1.popitem(last=False)
+
+    def _l1_delete(self, keys):
+        with self._lock:
+            if CLEAR_ALL in keys:
+                self._l1.clear()
+                return
+            for key in keys:
+                self._l1.pop(key, None)
+
+    def _resolve_timeout(self, timeout):
+        return self.default_timeout if timeout is DEFAULT_TIMEOUT else timeout
+
+    # ---------- Трансляція інвалідацій ----------
+
+    def _broadcast(self, keys):
+        """Записати подію інвалідації в журнал L2"""
+        try:
+            try:
+                seq = self.l2.incr(SEQ_KEY)
+            except ValueError:
+                self.l2.add(SEQ_KEY, 0, None)
+                seq = self.l2.incr(SEQ_KEY)
+            self.l2.set(EVENT_KEY.format(seq), list(keys), EVENT_TIMEOUT)
+            # Власні події вже застосовані до L1
+            if self._seen_seq == seq - 1:
+                self._seen_seq = seq
+        except Exception as e:
+            logger.warning(f'Не вдалося розіслати інвалідацію L1: {e}')
+
+    def _sync(self):
+        """Застосувати до L1 інвалідації інших воркерів"""
+        now = time.time()
+        if now - self._last_poll < self._poll_interval:
+            return
+        self._last_poll = now
+
+        try:
+            seq = self.l2.get(SEQ_KEY)
+        except Exception as e:
+            logger.warning(f'Не вдалося прочитати журнал інвалідацій: {e}')
+            return
+        if seq is None or self._seen_seq is None or seq < self._seen_seq:
+            # Перший запуск або журнал втрачено - починаємо з чистого L1
+            if self._seen_seq is not None:
+                self._l1_delete([CLEAR_ALL])
+            self._seen_seq = seq or 0
+        elif seq > self._seen_seq:
+            if seq - self._seen_seq > MAX_EVENTS_BEHIND:
+                self._l1_delete([CLEAR_ALL])
+            else:
+                event_keys = [EVENT_KEY.format(n) for n in range(self._seen_seq + 1, seq + 1)]
+                events = self.l2.get_many(event_keys)
+                if len(events) < len(event_keys):
+                    # Частину подій витіснено - надійніше очистити все
+                    self._l1_delete([CLEAR_ALL])
+                else:
+                    for keys in events.values():
+                        self._l1_delete(keys)
+            self._seen_seq = seq
+
+        if now - self._last_stats_flush >= STATS_FLUSH_INTERVAL:
+            self._flush_stats()
+
+    # ---------- Статистика ----------
+
+    def _count(self, name, amount=1):
+        self._stats[name] += amount
+        self._unflushed_stats[name] += amount
+
+    def _flush_stats(self):
+        self._last_stats_flush = time.time()
+        pending, self._unflushed_stats = self._unflushed_stats, dict.fromkeys(STAT_NAMES, 0)
+        for name, amount in pending.items():
+            if not amount:
+                continue
+            key = STATS_KEY.format(name)
+            try:
+                try:
+                    self.l2.incr(key, amount)
+                except ValueError:
+                    self.l2.set(key, amount, None)
+            except Exception as e:
+                logger.warning(f'Не вдалося зберегти статистику кешу: {e}')
+
+    @staticmethod
+    def _with_ratios(counters):
+        total = sum(counters.values())
+        result = dict(counters)
+        result['requests'] = total
+        result['l1_hit_ratio'] = counters['l1_hits'] / total if total else 0.0
+        result['l2_hit_ratio'] = counters['l2_hits'] / total if total else 0.0
+        result['hit_ratio'] = (counters['l1_hits'] + counters['l2_hits']) / total if total else 0.0
+        return result
+
+    def stats(self):
+        """Статистика влучань поточного воркера"""
+        result = self._with_ratios(self._stats)
+        result['l1_entries'] = len(self._l1)
+        return result
+
+    def shared_stats(self):
+        """Сумарна статистика всіх воркерів (зливається в L2 раз на хвилину)"""
+        self._flush_stats()
+        values = self.l2.get_many([STATS_KEY.format(name) for name in STAT_NAMES])
+        return self._with_ratios({name: values.get(STATS_KEY.format(name), 0) for name in STAT_NAMES})
+
+    def reset_stats(self):
+        self._stats = dict.fromkeys(STAT_NAMES, 0)
+        self._unflushed_stats = dict.fromkeys(STAT_NAMES, 0)
+        self.l2.delete_many([STATS_KEY.format(name) for name in STAT_NAMES])
+
+    # ---------- API кешу ----------
+
+    def get(self, key, default=None, version=None):
+        self._sync()
+        made_key = self.make_and_validate_key(key, version=version)
+        value = self._l1_get(made_key)
+        if value is not self._missing_key:
+            self._count('l1_hits')
+            return value
+        value = self.l2.get(made_key, self._missing_key)
+        if value is self._missing_key:
+            self._count('misses')
+            return default
+        self._count('l2_hits')
+        self._l1_set(made_key, value, None)
+        return value
+
+    def get_many(self, keys, version=None):
+        self._sync()
+        result = {}
+        missing = {}
+        for key in keys:
+            made_key = self.make_and_validate_key(key, version=version)
+            value = self._l1_get(made_key)
+            if value is self._missing_key:
+                missing[made_key] = key
+            else:
+                self._count('l1_hits')
+                result[key] = value
+        if missing:
+            found = self.l2.get_many(list(missing))
+            for made_key, value in found.items():
+                result[missing[made_key]] = value
+                self._l1_set(made_key, value, None)
+            self._count('l2_hits', len(found))
+            self._count('misses', len(missing) - len(found))
+        return result
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        made_key = self.make_and_validate_key(key, version=version)
+        timeout = self._resolve_timeout(timeout)
+        self.l2.set(made_key, value, timeout)
+        self._l1_set(made_key, value, timeout)
+        self._broadcast([made_key])
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        timeout = self._resolve_timeout(timeout)
+        made = {self.make_and_validate_key(key, version=version): value for key, value in data.items()}
+        failed = self.l2.set_many(made, timeout)
+        for made_key, value in made.items():
+            self._l1_set(made_key, value, timeout)
+        if made:
+            self._broadcast(list(made))
+        return failed
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        # add() використовується для lock-ів, тому завжди йде напряму в L2
+        made_key = self.make_and_validate_key(key, version=version)
+        self._l1_delete([made_key])
+        return self.l2.add(made_key, value, self._resolve_timeout(timeout))
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        made_key = self.make_and_validate_key(key, version=version)
+        return self.l2.touch(made_key, self._resolve_timeout(timeout))
+
+    def incr(self, key, delta=1, version=None):
+        made_key = self.make_and_validate_key(key, version=version)
+        value = self.l2.incr(made_key, delta)
+        self._l1_delete([made_key])
+        self._broadcast([made_key])
+        return value
+
+    def delete(self, key, version=None):
+        made_key = self.make_and_validate_key(key, version=version)
+        deleted = self.l2.delete(made_key)
+        self._l1_delete([made_key])
+        self._broadcast([made_key])
+        return deleted
+
+    def delete_many(self, keys, version=None):
+        made_keys = [self.make_and_validate_key(key, version=version) for key in keys]
+        if not made_keys:
+            return
+        self.l2.delete_many(made_keys)
+        self._l1_delete(made_keys)
+        self._broadcast(made_keys)
+
+    def has_key(self, key, version=None):
+        return self.get(key, self._missing_key, version=version) is not self._missing_key
+
+    def clear(self):
+        self.l2.clear()
+        self._l1_delete([CLEAR_ALL])
+        self._broadcast([CLEAR_ALL])
+
+    def close(self, **kwargs):
+        self.l2.close(**kwargs)
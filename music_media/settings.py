@@ -64,9 +64,9 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
-                # Вимикаємо categories для адмінки, щоб уникнути проблем з Python 3.14
-                # Категорії додаються вручну в views
-                # 'articles.context_processors.categories',
+                # Категорії навігації - незмінний кортеж з кешу процесу (не QuerySet),
+                # тому копіювання контексту в адмінці на Python 3.14 безпечне
+                'articles.context_processors.categories',
             ],
         },
     },
@@ -304,17 +304,54 @@ CRISPY_ALLOWED_TEMPLATE_PACKS = "bootstrap5"
 CRISPY_TEMPLATE_PACK = "bootstrap5"
 
 # File upload settings
-FILE_UPLOAD_MAX_MEMORY_SIZE = 104857600  # 100MB (для відео)
+# Файли, більші за поріг, Django записує у тимчасовий файл на диску, а не в пам'ять
+# воркера; відео потім завантажується на Cloudinary частинами (articles/storage.py)
+FILE_UPLOAD_MAX_MEMORY_SIZE = config('FILE_UPLOAD_MAX_MEMORY_SIZE', default=2621440, cast=int)  # 2.5MB
 DATA_UPLOAD_MAX_MEMORY_SIZE = 104857600  # 100MB
 
+# Відновлювані завантаження відео з адмінки (services/uploads.py): браузер надсилає
+# файл частинами, вони дописуються у тимчасовий файл, а в storage файл
+# переноситься у фоновому потоці
+RESUMABLE_UPLOAD_DIR = config('RESUMABLE_UPLOAD_DIR', default=os.path.join(BASE_DIR, 'tmp', 'uploads'))
+RESUMABLE_UPLOAD_CHUNK_SIZE = config('RESUMABLE_UPLOAD_CHUNK_SIZE', default=6 * 1024 * 1024, cast=int)
+RESUMABLE_UPLOAD_MAX_SIZE = config('RESUMABLE_UPLOAD_MAX_SIZE', default=2 * 1024 ** 3, cast=int)  # 2GB
+
 # Cache settings
+# default - дворівневий кеш: LRU у пам'яті воркера (L1) + спільний кеш (L2)
+# shared - спільний для всіх воркерів кеш: Redis, якщо задано REDIS_URL
+# (потребує пакет redis), інакше файловий кеш як локальна заміна
+REDIS_URL = config('REDIS_URL', default='')
+if REDIS_URL:
+    SHARED_CACHE = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_URL,
+    }
+else:
+    import tempfile
+    SHARED_CACHE = {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(tempfile.gettempdir(), 'music_media_cache'),
+        'OPTIONS': {
+            'MAX_ENTRIES': 10000,
+        },
+    }
+
 CACHES = {
     'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'unique-snowflake',
-    }
+        'BACKEND': 'music_media.cache_backends.TwoTierCache',
+        'OPTIONS': {
+            'L2_CACHE': 'shared',
+            'L1_MAX_ENTRIES': 1000,
+            'L1_MAX_AGE': 60,
+            'INVALIDATION_POLL_INTERVAL': 0.5,
+        },
+    },
+    'shared': SHARED_CACHE,
 }
 
+# Перегляди статей буферизуються і записуються в БД пакетом раз на стільки секунд
+VIEWS_FLUSH_INTERVAL = config('VIEWS_FLUSH_INTERVAL', default=10, cast=int)
+
 # Session settings
 SESSION_COOKIE_AGE = 86400  # 1 day
 SESSION_COOKIE_SECURE = True  # Для HTTPS на Render
@@ -6,20 +6,14 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
-from django.contrib.sitemaps.views import sitemap
 from django.views.generic import TemplateView
-from articles.sitemaps import ArticleSitemap, CategorySitemap, TagSitemap
-
-sitemaps = {
-    'articles': ArticleSitemap,
-    'categories': CategorySitemap,
-    'tags': TagSitemap,
-}
+from articles import views as article_views
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('', include('articles.urls')),
-    path('sitemap.xml', sitemap, {'sitemaps': sitemaps}, name='django.contrib.sitemaps.views.sitemap'),
+    path('sitemap.xml', article_views.sitemap_index, name='sitemap'),
+    path('sitemap-<str:section>.xml', article_views.sitemap_section, name='sitemap_section'),
     path('robots.txt', TemplateView.as_view(template_name='robots.txt', content_type='text/plain')),
 ]
 
@@ -2,24 +2,55 @@
 Сервісний рівень для роботи зі статтями
 Чистий код без бізнес-логіки в views
 """
-from django.core.cache import cache
-from django.core.paginator import Paginator
+import hashlib
 from django.db.models import Q, Count
-from articles.models import Article, Category, Tag
+from articles.models import Article, Category, Tag, RelatedArticle
+from services.cache import LATEST, FEATURED, POPULAR, LISTING, make_key, get_or_compute
+from services.search import SearchResults
+from services.dto import ArticleCard, pack_cards, unpack_cards
+from services.pagination import KeysetPaginator, CachedCountPaginator
+from services.view_counter import view_counter
+
+# Списки інвалідуються сигналами (articles/signals.py), тому TTL може бути довгим
+LIST_CACHE_TIMEOUT = 60 * 60 * 6  # 6 годин
+# Трендова оцінка перераховується періодично і не інвалідує кеш
+POPULAR_CACHE_TIMEOUT = 60 * 15  # 15 хвилин
 
 
 class ArticleService:
     """Сервіс для роботи зі статтями"""
 
+    @staticmethod
+    def _cached_cards(cache_key, queryset_func, timeout):
+        """
+        Закешований список карток: у кеші зберігаються компактні ArticleCard,
+        а не екземпляри Article
+        """
+        def compute():
+            return pack_cards(ArticleCard.from_articles(queryset_func()))
+        
+        return unpack_cards(get_or_compute(cache_key, compute, timeout))
+
+    @staticmethod
+    def _paginate(articles, count_key, page=None, cursor=None, per_page=12):
+        """
+        Пагінація з перетворенням статей сторінки на картки.
+        За замовчуванням - курсорна (cursor); якщо явно передано номер
+        сторінки (page) - класична з закешованою кількістю записів.
+        """
+        if page is not None:
+            page_obj = CachedCountPaginator(articles, per_page, count_key=count_key).get_page(page)
+        else:
+            page_obj = KeysetPaginator(articles, per_page).get_page(cursor)
+        page_obj.object_list = ArticleCard.from_articles(page_obj.object_list)
+        return page_obj
+
     @staticmethod
     def get_latest_articles(limit=10, category_slug=None):
         """
         Отримати останні опубліковані статті
         """
-        cache_key = f'latest_articles_{category_slug or "all"}_{limit}'
-        articles = cache.get(cache_key)
-        
-        if articles is None:
+        def compute():
             queryset = Article.objects.filter(
                 status='published'
             ).select_related('author', 'category').prefetch_related('tags')
@@ -27,32 +58,38 @@ class ArticleService:
             if category_slug:
                 queryset = queryset.filter(category__slug=category_slug)
             
-            articles = list(queryset[:limit])
-            cache.set(cache_key, articles, 300)  # Кеш на 5 хвилин
+            return queryset[:limit]
         
-        return articles
+        cache_key = make_key(LATEST, category_slug or 'all', limit)
+        return ArticleService._cached_cards(cache_key, compute, LIST_CACHE_TIMEOUT)
 
     @staticmethod
     def get_featured_articles(limit=5):
         """
         Отримати рекомендовані статті
         """
-        cache_key = f'featured_articles_{limit}'
-        articles = cache.get(cache_key)
+        def compute():
+            return Article.objects.filter(
+                status='published',
+                is_featured=True
+            ).select_related('author', 'category').prefetch_related('tags')[:limit]
         
-        if articles is None:
-            articles = list(
-                Article.objects.filter(
-                    status='published',
-                    is_featured=True
-                ).select_related('author', 'category').prefetch_related('tags')[:limit]
-            )
-            cache.set(cache_key, articles, 600)  # Кеш на 10 хвилин
+        cache_key = make_key(FEATURED, limit)
+        return ArticleService._cached_cards(cache_key, compute, LIST_CACHE_TIMEOUT)
+
+    @staticmethod
+    def get_articles_page(page=None, cursor=None, per_page=12):
+        """
+        Отримати всі опубліковані статті з пагінацією
+        """
+        articles = Article.objects.filter(
+            status='published'
+        ).select_related('author', 'category').prefetch_related('tags')
         
-        return articles
+        return ArticleService._paginate(articles, 'all', page, cursor, per_page)
 
     @staticmethod
-    def get_articles_by_category(category_slug, page=1, per_page=12):
+    def get_articles_by_category(category_slug, page=None, cursor=None, per_page=12):
         """
         Отримати статті за категорією з пагінацією
         """
@@ -66,13 +103,10 @@ class ArticleService:
             status='published'
         ).select_related('author', 'category').prefetch_related('tags')
         
-        paginator = Paginator(articles, per_page)
-        page_obj = paginator.get_page(page)
-        
-        return page_obj, category
+        return ArticleService._paginate(articles, f'category:{category.id}', page, cursor, per_page), category
 
     @staticmethod
-    def get_articles_by_tag(tag_slug, page=1, per_page=12):
+    def get_articles_by_tag(tag_slug, page=None, cursor=None, per_page=12):
         """
         Отримати статті за тегом з пагінацією
         """
@@ -86,34 +120,22 @@ class ArticleService:
             status='published'
         ).select_related('author', 'category').prefetch_related('tags')
         
-        paginator = Paginator(articles, per_page)
-        page_obj = paginator.get_page(page)
-        
-        return page_obj, tag
+        return ArticleService._paginate(articles, f'tag:{tag.id}', page, cursor, per_page), tag
 
     @staticmethod
-    def get_popular_articles(limit=10, days=30):
+    def get_popular_articles(limit=10):
         """
-        Отримати популярні статті за кількістю переглядів
+        Отримати популярні зараз статті (за трендовою оцінкою, див. services/trending.py)
         """
-        from django.utils import timezone
-        from datetime import timedelta
-        
-        cache_key = f'popular_articles_{days}_{limit}'
-        articles = cache.get(cache_key)
-        
-        if articles is None:
-            date_threshold = timezone.now() - timedelta(days=days)
-            articles = list(
-                Article.objects.filter(
-                    status='published',
-                    published_at__gte=date_threshold
-                ).select_related('author', 'category').prefetch_related('tags')
-                .order_by('-views_count')[:limit]
-            )
-            cache.set(cache_key, articles, 600)  # Кеш на 10 хвилин
+        def compute():
+            return Article.objects.filter(
+                status='published'
+            ).select_related('author', 'category').prefetch_related('tags').order_by(
+                '-trending_score', '-views_count'
+            )[:limit]
         
-        return articles
+        cache_key = make_key(POPULAR, limit)
+        return ArticleService._cached_cards(cache_key, compute, POPULAR_CACHE_TIMEOUT)
 
     @staticmethod
     def get_article_by_slug(slug):
@@ -129,36 +151,27 @@ class ArticleService:
             return None
 
     @staticmethod
-    def increment_views(article):
+    def increment_views(article, visitor=None):
         """
         Збільшити кількість переглядів статті
+        (visitor - анонімний id відвідувача для підрахунку унікальних читачів)
         """
-        article.increment_views()
-        # Очистити кеш популярних статей
-        cache.delete_many([
-            'popular_articles_30_10',
-            'popular_articles_7_10',
-        ])
+        # Перегляд потрапляє в буфер і записується в БД пакетом (services/view_counter.py);
+        # списки не інвалідуються: популярне оновлюється за POPULAR_CACHE_TIMEOUT
+        view_counter.record(article.id, visitor)
+        article.views_count += 1
 
     @staticmethod
     def search_articles(query, page=1, per_page=12):
         """
-        Пошук статей за запитом
+        Повнотекстовий пошук статей, відсортованих за релевантністю
         """
-        articles = Article.objects.filter(
-            Q(title__icontains=query) |
-            Q(short_description__icontains=query) |
-            Q(content__icontains=query),
-            status='published'
-        ).select_related('author', 'category').prefetch_related('tags').distinct()
-        
-        paginator = Paginator(articles, per_page)
-        page_obj = paginator.get_page(page)
-        
-        return page_obj
+        query_hash = hashlib.md5(query.lower().encode()).hexdigest()
+        paginator = CachedCountPaginator(SearchResults(query), per_page, count_key=f'search:{query_hash}')
+        return paginator.get_page(page)
 
     @staticmethod
-    def get_articles_by_author(username, page=1, per_page=12):
+    def get_articles_by_author(username, page=None, cursor=None, per_page=12):
         """
         Отримати статті автора з пагінацією
         """
@@ -174,20 +187,22 @@ class ArticleService:
             status='published'
         ).select_related('author', 'category').prefetch_related('tags')
         
-        paginator = Paginator(articles, per_page)
-        page_obj = paginator.get_page(page)
-        
-        return page_obj, author
+        return ArticleService._paginate(articles, f'author:{author.id}', page, cursor, per_page), author
 
     @staticmethod
     def get_related_articles(article, limit=4):
         """
-        Отримати схожі статті (за категорією та тегами)
+        Отримати схожі статті з матеріалізованої таблиці RelatedArticle
+        (див. services/related.py)
         """
-        related = Article.objects.filter(
-            Q(category=article.category) | Q(tags__in=article.tags.all()),
-            status='published'
-        ).exclude(id=article.id).select_related('author', 'category').prefetch_related('tags').distinct()[:limit]
+        def compute():
+            related_ids = list(
+                RelatedArticle.objects.filter(article_id=article.id).values_list('related_id', flat=True)[:limit]
+            )
+            articles = Article.objects.filter(
+                id__in=related_ids, status='published'
+            ).select_related('author', 'category').prefetch_related('tags').in_bulk()
+            return [articles[pk] for pk in related_ids if pk in articles]
         
-        return list(related)
-
+        cache_key = make_key(LISTING, 'related', article.id, limit)
+        return ArticleService._cached_cards(cache_key, compute, LIST_CACHE_TIMEOUT)
@@ -0,0 +1,101 @@
+"""
+Масові операції зі статтями
+
+Кожна операція - один UPDATE (або одна пакетна вставка/видалення в таблиці
+тегів) для всього вибору. Сигнали моделей при цьому не надсилаються, тому
+інвалідація кешу, пошуковий індекс і схожі статті оновлюються тут один раз
+для всієї групи статей після коміту транзакції.
+"""
+import logging
+from django.db import transaction
+from django.db.models import Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from articles.models import Article
+from services.cache import ARTICLE_NAMESPACES, bump_on_commit
+from services.related import RelatedArticleService
+from services.search import get_search_backend
+
+logger = logging.getLogger(__name__)
+
+
+class ArticleBulkService:
+    """Set-based зміни для вибору статей"""
+
+    @staticmethod
+    def _reindex(ids):
+        backend = get_search_backend()
+        rows = list(
+            Article.objects.filter(id__in=ids, status='published').values_list(
+                'id', 'title', 'short_description', 'content'
+            )
+        )
+        published = {row[0] for row in rows}
+        backend.remove([pk for pk in ids if pk not in published])
+        backend.index(rows)
+
+    @staticmethod
+    def _changed(ids, search=False, related=False):
+        """Одна групова інвалідація після зміни статей ids"""
+        if not ids:
+            return
+        bump_on_commit(*ARTICLE_NAMESPACES)
+        if search:
+            transaction.on_commit(lambda: ArticleBulkService._reindex(ids))
+        if related:
+            RelatedArticleService.update_on_commit(*ids)
+        logger.info(f'Масова зміна статей: {len(ids)}')
+
+    @staticmethod
+    def _update(queryset, search=False, related=False, **fields):
+        ids = list(queryset.values_list('id', flat=True))
+        with transaction.atomic():
+            count = Article.objects.filter(id__in=ids).update(updated_at=timezone.now(), **fields)
+            ArticleBulkService._changed(ids, search=search, related=related)
+        return count
+
+    @staticmethod
+    def publish(queryset):
+        """Опублікувати; published_at ставиться лише тим, у кого його ще немає"""
+        now = timezone.now()
+        return ArticleBulkService._update(
+            queryset,
+            search=True,
+            related=True,
+            status='published',
+            published_at=Coalesce('published_at', Value(now)),
+        )
+
+    @staticmethod
+    def unpublish(queryset):
+        return ArticleBulkService._update(queryset, search=True, related=True, status='draft')
+
+    @staticmethod
+    def set_featured(queryset, is_featured):
+        return ArticleBulkService._update(queryset, is_featured=is_featured)
+
+    @staticmethod
+    def set_category(queryset, category):
+        return ArticleBulkService._update(queryset, related=True, category=category)
+
+    @staticmethod
+    def add_tags(queryset, tags):
+        """Додати теги одним bulk INSERT (існуючі зв'язки пропускаються)"""
+        ids = list(queryset.values_list('id', flat=True))
+        through = Article.tags.through
+        links = [through(article_id=pk, tag_id=tag.id) for pk in ids for tag in tags]
+        with transaction.atomic():
+            through.objects.bulk_create(links, ignore_conflicts=True, batch_size=1000)
+            Article.objects.filter(id__in=ids).update(updated_at=timezone.now())
+            ArticleBulkService._changed(ids, related=True)
+        return len(ids)
+
+    @staticmethod
+    def remove_tags(queryset, tags):
+        ids = list(queryset.values_list('id', flat=True))
+        through = Article.tags.through
+        with transaction.atomic():
+            through.objects.filter(article_id__in=ids, tag_id__in=[tag.id for tag in tags]).delete()
+            Article.objects.filter(id__in=ids).update(updated_at=timezone.now())
+            ArticleBulkService._changed(ids, related=True)
+        return len(ids)
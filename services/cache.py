@@ -0,0 +1,169 @@
+"""
+Кешування з інвалідацією через лічильники поколінь (generations)
+
+Кожна родина ключів (namespace) має власний лічильник покоління у кеші.
+Покоління входить до складу ключа, тому для інвалідації достатньо
+збільшити лічильник - старі записи більше ніколи не читаються
+і просто вичищаються кешем за TTL.
+
+get_or_compute() захищає від "лавини" запитів при закінченні TTL:
+перерахунок виконує лише один процес (lock у кеші), запис може бути
+оновлений трохи раніше терміну (probabilistic early expiration), а поки
+йде фонове оновлення - усі отримують попереднє значення.
+"""
+import math
+import time
+import random
+import logging
+import threading
+from django.core.cache import cache
+from django.db import connections, transaction
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = 'mm'
+
+# Родини ключів
+LATEST = 'latest'          # Останні статті (загалом і по категоріях)
+FEATURED = 'featured'      # Рекомендовані статті
+POPULAR = 'popular'        # Популярні статті за період
+LISTING = 'listing'        # Сторінки списків (категорії, теги, автори)
+HOME = 'home'              # Дані головної сторінки
+SITEMAP = 'sitemap'        # Згенеровані sitemap.xml
+NAVIGATION = 'navigation'  # Категорії в меню та футері
+
+# Усі родини, які залежать від вмісту статей
+ARTICLE_NAMESPACES = (LATEST, FEATURED, POPULAR, LISTING, HOME, SITEMAP)
+
+# Скільки після закінчення TTL ще можна віддавати застаріле значення
+STALE_TIMEOUT = 60 * 60
+# Максимальний час утримання lock-а на перерахунок
+LOCK_TIMEOUT = 30
+# Скільки чекати на значення, яке рахує інший процес
+LOCK_WAIT = 5
+# Через скільки повторити оновлення після помилки БД
+ERROR_RETRY_DELAY = 30
+# Коефіцієнт ранньої експірації (більше - раніше оновлюємо)
+EARLY_EXPIRATION_BETA = 1.0
+
+
+def _generation_key(namespace):
+    return f'{CACHE_PREFIX}:gen:{namespace}'
+
+
+def _initial_generation():
+    # Початкове значення залежить від часу, щоб після витіснення лічильника
+    # з кешу не "воскресали" записи зі старим номером покоління
+    return int(time.time() * 1000)
+
+
+def get_generation(namespace):
+    """Поточне покоління родини ключів"""
+    key = _generation_key(namespace)
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, _initial_generation(), None)
+        generation = cache.get(key) or _initial_generation()
+    return generation
+
+
+def make_key(namespace, *parts):
+    """
+    Побудувати ключ кешу з урахуванням покоління родини
+    make_key(LATEST, 'all', 6) -> 'mm:latest:<gen>:all:6'
+    """
+    suffix = ':'.join(str(part) for part in parts)
+    return f'{CACHE_PREFIX}:{namespace}:{get_generation(namespace)}:{suffix}'
+
+
+def bump(*namespaces):
+    """Інвалідувати родини ключів, збільшивши їх покоління"""
+    for namespace in namespaces:
+        key = _generation_key(namespace)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Лічильника ще немає (або його витіснено) - стартуємо заново
+            cache.set(key, _initial_generation(), None)
+    logger.debug(f'Інвалідовано кеш: {", ".join(namespaces)}')
+
+
+def bump_on_commit(*namespaces):
+    """
+    Інвалідувати родини ключів після фіксації транзакції,
+    щоб паралельні запити не закешували дані, які ще не видно в БД
+    """
+    transaction.on_commit(lambda: bump(*namespaces))
+
+
+def _lock_key(key):
+    return f'{key}:lock'
+
+
+def _should_refresh(expires_at, delta, now):
+    """
+    Probabilistic early expiration (XFetch): чим ближче до кінця TTL
+    і чим довше рахується значення, тим імовірніше оновити його заздалегідь
+    """
+    return now - delta * EARLY_EXPIRATION_BETA * math.log(1.0 - random.random()) >= expires_at
+
+
+def _store(key, value, delta, timeout, stale_timeout):
+    entry = (value, time.time() + timeout, delta)
+    cache.set(key, entry, timeout + stale_timeout)
+
+
+def _recompute(key, compute, timeout, stale_timeout):
+    started = time.time()
+    value = compute()
+    _store(key, value, time.time() - started, timeout, stale_timeout)
+    return value
+
+
+def _refresh(key, compute, timeout, stale_timeout, entry):
+    try:
+        _recompute(key, compute, timeout, stale_timeout)
+    except Exception as e:
+        # Продовжуємо віддавати останнє коректне значення
+        logger.error(f'Не вдалося оновити кеш {key}: {e}')
+        value, _, delta = entry
+        _store(key, value, delta, ERROR_RETRY_DELAY, stale_timeout)
+    finally:
+        cache.delete(_lock_key(key))
+        # Фоновий потік має власне з'єднання з БД - закриваємо його
+        connections.close_all()
+
+
+def get_or_compute(key, compute, timeout, stale_timeout=STALE_TIMEOUT):
+    """
+    Отримати значення з кешу або обчислити його через compute()
+
+    - свіже значення повертається одразу;
+    - застаріле значення повертається одразу, а один процес оновлює його у фоні;
+    - при холодному кеші рахує лише той, хто отримав lock, інші чекають.
+    """
+    entry = cache.get(key)
+    if entry is not None:
+        value, expires_at, delta = entry
+        if _should_refresh(expires_at, delta, time.time()) and cache.add(_lock_key(key), 1, LOCK_TIMEOUT):
+            threading.Thread(
+                target=_refresh,
+                args=(key, compute, timeout, stale_timeout, entry),
+                daemon=True,
+            ).start()
+        return value
+
+    if cache.add(_lock_key(key), 1, LOCK_TIMEOUT):
+        try:
+            return _recompute(key, compute, timeout, stale_timeout)
+        finally:
+            cache.delete(_lock_key(key))
+
+    # Значення вже рахує інший запит - чекаємо на результат
+    deadline = time.time() + LOCK_WAIT
+    while time.time() < deadline:
+        time.sleep(0.05)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry[0]
+    return _recompute(key, compute, timeout, stale_timeout)
@@ -0,0 +1,148 @@
+"""
+Компактні об'єкти для кешування карток статей
+
+Замість повних екземплярів Article (з контентом, пов'язаними User/Category
+і кешем prefetch тегів) у кеші зберігаються лише поля, які рендерить картка.
+"""
+import zlib
+import pickle
+import logging
+from collections import namedtuple
+from django.urls import reverse
+
+logger = logging.getLogger(__name__)
+
+# Стискати серіалізовані списки, більші за цей розмір (байт)
+COMPRESS_THRESHOLD = 1024
+COMPRESS_LEVEL = 6
+
+_RAW = b'\x00'
+_ZLIB = b'\x01'
+
+# Облік розмірів серіалізованих даних (на процес)
+SERIALIZATION_STATS = {
+    'packed': 0,
+    'compressed': 0,
+    'raw_bytes': 0,
+    'stored_bytes': 0,
+}
+
+
+class TagRef(namedtuple('TagRef', ['name', 'slug'])):
+    """Тег у картці статті"""
+    __slots__ = ()
+
+    @property
+    def url(self):
+        return reverse('articles:tag_detail', kwargs={'slug': self.slug})
+
+
+class ArticleCard:
+    """Дані для картки статті в списках"""
+    __slots__ = (
+        'id', 'slug', 'title', 'short_description', 'image_url',
+        'category_name', 'category_slug', 'author_name',
+        'published_at', 'reading_time', 'views_count', 'tags',
+        # LQIP-заглушка та основний колір зображення
+        'image_placeholder', 'image_color',
+        # Підсвічений фрагмент для результатів пошуку (не кешується)
+        'snippet',
+    )
+
+    def __init__(self, id, slug, title, short_description, image_url,
+                 category_name, category_slug, author_name,
+                 published_at, reading_time, views_count, tags,
+                 image_placeholder='', image_color=''):
+        self.id = id
+        self.slug = slug
+        self.title = title
+        self.short_description = short_description
+        self.image_url = image_url
+        self.category_name = category_name
+        self.category_slug = category_slug
+        self.author_name = author_name
+        self.published_at = published_at
+        self.reading_time = reading_time
+        self.views_count = views_count
+        self.tags = tuple(TagRef(*tag) for tag in tags)
+        self.image_placeholder = image_placeholder
+        self.image_color = image_color
+        self.snippet = None
+
+    @classmethod
+    def from_article(cls, article):
+        """Створити картку з екземпляра Article (з select_related/prefetch_related)"""
+        category = article.category
+        author = article.author
+        return cls(
+            id=article.id,
+            slug=article.slug,
+            title=article.title,
+            short_description=article.short_description,
+            image_url=article.get_featured_image_url() if article.featured_image else None,
+            category_name=category.name if category else None,
+            category_slug=category.slug if category else None,
+            author_name=author.get_full_name() or author.username,
+            published_at=article.published_at,
+            reading_time=article.reading_time,
+            views_count=article.views_count,
+            tags=[(tag.name, tag.slug) for tag in article.tags.all()],
+            image_placeholder=article.image_placeholder if article.featured_image else '',
+            image_color=article.image_color if article.featured_image else '',
+        )
+
+    @classmethod
+    def from_articles(cls, articles):
+        return [cls.from_article(article) for article in articles]
+
+    def get_absolute_url(self):
+        return reverse('articles:article_detail', kwargs={'slug': self.slug})
+
+    def to_row(self):
+        """Кортеж полів для компактної серіалізації"""
+        return (
+            self.id, self.slug, self.title, self.short_description, self.image_url,
+            self.category_name, self.category_slug, self.author_name,
+            self.published_at, self.reading_time, self.views_count,
+            tuple(tuple(tag) for tag in self.tags),
+            self.image_placeholder, self.image_color,
+        )
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(*row)
+
+    def __reduce__(self):
+        return (self.from_row, (self.to_row(),))
+
+    def __eq__(self, other):
+        return isinstance(other, ArticleCard) and self.to_row() == other.to_row()
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def __repr__(self):
+        return f'<ArticleCard {self.id}: {self.slug}>'
+
+
+def pack_cards(cards, compress_threshold=COMPRESS_THRESHOLD):
+    """Серіалізувати список карток у bytes (стискаючи великі списки zlib)"""
+    raw = pickle.dumps([card.to_row() for card in cards], pickle.HIGHEST_PROTOCOL)
+    SERIALIZATION_STATS['packed'] += 1
+    SERIALIZATION_STATS['raw_bytes'] += len(raw)
+    if compress_threshold is not None and len(raw) > compress_threshold:
+        data = _ZLIB + zlib.compress(raw, COMPRESS_LEVEL)
+        SERIALIZATION_STATS['compressed'] += 1
+    else:
+        data = _RAW + raw
+    SERIALIZATION_STATS['stored_bytes'] += len(data)
+    logger.debug(f'Серіалізовано {len(cards)} карток: {len(raw)} → {len(data)} байт')
+    return data
+
+
+def unpack_cards(data):
+    """Відновити список карток з bytes, отриманих від pack_cards()"""
+    flag, payload = data[:1], data[1:]
+    if flag == _ZLIB:
+        payload = zlib.decompress(payload)
+    return [ArticleCard.from_row(row) for row in pickle.loads(payload)]
@@ -0,0 +1,92 @@
+"""
+Сервіс даних головної сторінки
+
+Усі блоки головної (рекомендована, останні, популярні, інтервʼю, рецензії)
+вибираються одним запитом з віконними функціями ROW_NUMBER() та одним
+запитом тегів, а результат кешується як єдине ціле.
+"""
+from django.db.models import F, Q, Window
+from django.db.models.functions import RowNumber
+from articles.models import Article
+from services.cache import HOME, make_key, get_or_compute
+from services.dto import ArticleCard, pack_cards, unpack_cards
+
+# Популярне залежить від трендової оцінки, тому головна кешується як популярне
+HOME_CACHE_TIMEOUT = 60 * 15  # 15 хвилин
+
+FEATURED_LIMIT = 1
+LATEST_LIMIT = 6
+POPULAR_LIMIT = 6
+# Блоки категорій на головній: ключ контексту -> (slug категорії, кількість)
+CATEGORY_SECTIONS = {
+    'interviews': ('interviews', 4),
+    'reviews': ('reviews', 4),
+}
+
+
+class HomePageService:
+    """Сервіс для побудови даних головної сторінки"""
+
+    @staticmethod
+    def _query():
+        """Один віконний запит, що повертає статті для всіх блоків"""
+        newest_first = [F('published_at').desc(), F('id').desc()]
+        category_slugs = [slug for slug, _ in CATEGORY_SECTIONS.values()]
+        category_limit = max([limit for _, limit in CATEGORY_SECTIONS.values()], default=0)
+
+        return Article.objects.filter(
+            status='published'
+        ).select_related('author', 'category').prefetch_related('tags').defer(
+            'content', 'meta_title', 'meta_description',
+        ).annotate(
+            latest_rank=Window(RowNumber(), order_by=newest_first),
+            category_rank=Window(RowNumber(), partition_by=[F('category_id')], order_by=newest_first),
+            featured_rank=Window(RowNumber(), partition_by=[F('is_featured')], order_by=newest_first),
+            popular_rank=Window(
+                RowNumber(),
+                order_by=[F('trending_score').desc(), F('views_count').desc()],
+            ),
+        ).filter(
+            Q(latest_rank__lte=LATEST_LIMIT) |
+            Q(is_featured=True, featured_rank__lte=FEATURED_LIMIT) |
+            Q(popular_rank__lte=POPULAR_LIMIT) |
+            Q(category__slug__in=category_slugs, category_rank__lte=category_limit)
+        )
+
+    @staticmethod
+    def _build():
+        """Розкласти результат запиту по блоках (індекси в спільному списку карток)"""
+        articles = list(HomePageService._query())
+        cards = ArticleCard.from_articles(articles)
+        index = {article.id: position for position, article in enumerate(articles)}
+
+        def section(condition, rank, limit):
+            selected = sorted((a for a in articles if condition(a)), key=lambda a: getattr(a, rank))
+            return [index[a.id] for a in selected[:limit]]
+
+        sections = {
+            'featured_articles': section(lambda a: a.is_featured, 'featured_rank', FEATURED_LIMIT),
+            'latest_news': section(lambda a: True, 'latest_rank', LATEST_LIMIT),
+            'popular_articles': section(lambda a: True, 'popular_rank', POPULAR_LIMIT),
+        }
+        for name, (slug, limit) in CATEGORY_SECTIONS.items():
+            sections[name] = section(
+                lambda a, slug=slug: a.category is not None and a.category.slug == slug,
+                'category_rank',
+                limit,
+            )
+        return pack_cards(cards), sections
+
+    @staticmethod
+    def load():
+        """
+        Отримати дані головної сторінки:
+        featured_article, latest_news, popular_articles та блоки категорій
+        """
+        packed, sections = get_or_compute(make_key(HOME, 'page'), HomePageService._build, HOME_CACHE_TIMEOUT)
+        cards = unpack_cards(packed)
+
+        payload = {name: [cards[position] for position in positions] for name, positions in sections.items()}
+        featured = payload.pop('featured_articles')
+        payload['featured_article'] = featured[0] if featured else None
+        return payload
@@ -0,0 +1,140 @@
+"""
+Обробка зображень статей під час завантаження (Pillow)
+
+- орієнтація з EXIF застосовується до пікселів, а самі метадані EXIF
+  (камера, GPS тощо) не зберігаються;
+- розмір обмежується MAX_DIMENSION по більшій стороні;
+- JPEG/PNG/WebP перестискаються; інші формати зберігаються як JPEG
+  (або PNG, якщо є прозорість). Якщо результат не менший за оригінал і
+  нічого не змінилось, залишається оригінал;
+- обчислюється LQIP-заглушка (розмита мініатюра PLACEHOLDER_SIZE px у
+  data URI, кількасот байт) та основний колір. Вони зберігаються в статті і
+  вбудовуються в розмітку картки, тому до завантаження зображення місце
+  заповнене без додаткових запитів.
+"""
+import os
+import base64
+import logging
+from io import BytesIO
+from collections import namedtuple
+from django.core.files.base import ContentFile
+from PIL import Image, ImageFilter, ImageOps, UnidentifiedImageError
+
+logger = logging.getLogger(__name__)
+
+MAX_DIMENSION = 2560
+JPEG_QUALITY = 85
+WEBP_QUALITY = 85
+PLACEHOLDER_SIZE = 16
+PLACEHOLDER_BLUR = 1
+PLACEHOLDER_QUALITY = 40
+# Розмір зменшеної копії для пошуку основного кольору та кількість кольорів палітри
+COLOR_SAMPLE_SIZE = 64
+COLOR_PALETTE_SIZE = 5
+
+# Формати, що перестискаються без зміни формату: формат Pillow -> розширення
+OUTPUT_FORMATS = {'JPEG': 'jpg', 'PNG': 'png', 'WEBP': 'webp'}
+
+# content - файл для збереження в storage; placeholder - data URI; color - '#rrggbb'
+ProcessedImage = namedtuple('ProcessedImage', ['content', 'placeholder', 'color'])
+
+
+def _has_alpha(image):
+    return image.mode in ('RGBA', 'LA', 'PA') or (image.mode == 'P' and 'transparency' in image.info)
+
+
+def _flatten(image):
+    """RGB-копія (прозорі ділянки - на білому тлі)"""
+    if _has_alpha(image):
+        background = Image.new('RGBA', image.size, (255, 255, 255, 255))
+        return Image.alpha_composite(background, image.convert('RGBA')).convert('RGB')
+    return image.convert('RGB')
+
+
+def make_placeholder(image):
+    """LQIP: розмита мініатюра у data URI (WebP)"""
+    small = image.copy()
+    small.thumbnail((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE), Image.Resampling.BOX)
+    small = small.filter(ImageFilter.GaussianBlur(PLACEHOLDER_BLUR))
+    buffer = BytesIO()
+    small.save(buffer, 'WEBP', quality=PLACEHOLDER_QUALITY)
+    return 'data:image/webp;base64,' + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+
+def dominant_color(image):
+    """Найчастіший колір зменшеної палітри у форматі #rrggbb"""
+    sample = image.resize((COLOR_SAMPLE_SIZE, COLOR_SAMPLE_SIZE), Image.Resampling.BOX)
+    quantized = sample.quantize(colors=COLOR_PALETTE_SIZE)
+    _, index = max(quantized.getcolors())
+    r, g, b = quantized.getpalette()[index * 3:index * 3 + 3]
+    return f'#{r:02x}{g:02x}{b:02x}'
+
+
+def describe_image(image):
+    """(placeholder, color) для відкритого зображення Pillow"""
+    preview = image.copy()
+    preview.thumbnail((COLOR_SAMPLE_SIZE, COLOR_SAMPLE_SIZE), Image.Resampling.BOX)
+    preview = _flatten(preview)
+    return make_placeholder(preview), dominant_color(preview)
+
+
+def _encode(image, image_format):
+    """Байти зображення у форматі image_format без EXIF (ICC-профіль зберігається)"""
+    options = {'icc_profile': image.info.get('icc_profile')}
+    if image_format == 'JPEG':
+        if image.mode not in ('RGB', 'L'):
+            image = _flatten(image)
+        options.update(quality=JPEG_QUALITY, optimize=True, progressive=True)
+    elif image_format == 'WEBP':
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA' if _has_alpha(image) else 'RGB')
+        options.update(quality=WEBP_QUALITY)
+    else:
+        options.update(optimize=True)
+    buffer = BytesIO()
+    image.save(buffer, image_format, **{key: value for key, value in options.items() if value is not None})
+    return buffer.getvalue()
+
+
+def process_image(content):
+    """
+    Оптимізувати зображення content (File/ContentFile) перед збереженням.
+    Файл, який Pillow не може прочитати, повертається без змін і без заглушки.
+    """
+    try:
+        content.seek(0)
+        original = Image.open(content)
+        original.load()
+    except (UnidentifiedImageError, OSError, Image.DecompressionBombError) as e:
+        logger.warning(f'Не вдалося обробити зображення {getattr(content, "name", "")}: {e}')
+        content.seek(0)
+        return ProcessedImage(content, '', '')
+
+    image = ImageOps.exif_transpose(original)
+    placeholder, color = describe_image(image)
+
+    # Анімацію (GIF, анімований WebP) перестискання зіпсувало б
+    if getattr(original, 'is_animated', False):
+        content.seek(0)
+        return ProcessedImage(content, placeholder, color)
+
+    image_format = original.format
+    if image_format not in OUTPUT_FORMATS:
+        image_format = 'PNG' if _has_alpha(image) else 'JPEG'
+    resized = max(image.size) > MAX_DIMENSION
+    if resized:
+        image.thumbnail((MAX_DIMENSION, MAX_DIMENSION), Image.Resampling.LANCZOS)
+    data = _encode(image, image_format)
+
+    changed = resized or image_format != original.format or 'exif' in original.info
+    if not changed and len(data) >= content.size:
+        content.seek(0)
+        return ProcessedImage(content, placeholder, color)
+
+    root = os.path.basename(content.name or '').rsplit('.', 1)[0] or 'image'
+    processed = ContentFile(data, name=f'{root}.{OUTPUT_FORMATS[image_format]}')
+    # URL джерела потрібен реєстру медіа (services/media.py)
+    if getattr(content, 'source_url', None):
+        processed.source_url = content.source_url
+    logger.debug(f'Зображення {content.name}: {content.size} → {len(data)} байт')
+    return ProcessedImage(processed, placeholder, color)
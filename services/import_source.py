@@ -0,0 +1,149 @@
+"""
+Потокове читання файлів імпорту статей
+
+Підтримуються NDJSON (.ndjson/.jsonl - один JSON-об'єкт на рядок) та JSON
+(масив об'єктів). Файл читається частинами, тому пам'ять не залежить від його
+розміру. Прогрес зберігається у файлі стану (ImportCheckpoint) після кожного
+завершеного пакета, і перерваний імпорт продовжується з того ж запису.
+"""
+import os
+import json
+import logging
+from collections import namedtuple
+
+logger = logging.getLogger(__name__)
+
+READ_SIZE = 64 * 1024
+NDJSON_EXTENSIONS = ('.ndjson', '.jsonl')
+
+REQUIRED_FIELDS = ('title', 'short_description', 'content', 'author_username')
+STRING_FIELDS = (
+    'title', 'slug', 'short_description', 'content', 'author_username', 'category',
+    'status', 'published_at', 'meta_title', 'meta_description', 'featured_image_url',
+)
+STATUSES = ('draft', 'published')
+
+# number - номер запису (рядка для NDJSON); offset - позиція у файлі після запису
+SourceRecord = namedtuple('SourceRecord', ['number', 'data', 'error', 'offset'])
+
+
+def validate_record(data):
+    """Текст помилки для некоректного запису або None"""
+    if not isinstance(data, dict):
+        return 'запис не є JSON-об\'єктом'
+    missing = [name for name in REQUIRED_FIELDS if not data.get(name)]
+    if missing:
+        return f'відсутні поля: {", ".join(missing)}'
+    for name in STRING_FIELDS:
+        if data.get(name) is not None and not isinstance(data[name], str):
+            return f'поле {name} має бути рядком'
+    if data.get('status', 'published') not in STATUSES:
+        return f'невідомий статус "{data["status"]}"'
+    tags = data.get('tags') or []
+    if not isinstance(tags, list) or not all(isinstance(tag, str) and tag for tag in tags):
+        return 'tags має бути списком рядків'
+    return None
+
+
+def _checked(number, data, offset):
+    return SourceRecord(number, data, validate_record(data), offset)
+
+
+def _read_ndjson(path, offset, number):
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        for line in f:
+            offset += len(line)
+            number += 1
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                data = json.loads(line)
+            except ValueError as e:
+                yield SourceRecord(number, None, f'некоректний JSON: {e}', offset)
+                continue
+            yield _checked(number, data, offset)
+
+
+def _read_json_array(path, skip):
+    """
+    Елементи JSON-масиву по одному, без завантаження файлу цілком.
+    offset тут - кількість прочитаних елементів (для продовження їх пропускають).
+    """
+    decoder = json.JSONDecoder()
+    number = 0
+    with open(path, encoding='utf-8') as f:
+        buffer = f.read(READ_SIZE).lstrip()
+        if not buffer.startswith('['):
+            raise ValueError('JSON-файл імпорту має містити масив статей')
+        buffer = buffer[1:]
+        eof = False
+        while True:
+            buffer = buffer.lstrip().lstrip(',').lstrip()
+            if buffer.startswith(']'):
+                return
+            try:
+                data, end = decoder.raw_decode(buffer)
+            except ValueError:
+                if eof:
+                    raise ValueError(f'некоректний JSON після запису {number}')
+                chunk = f.read(READ_SIZE)
+                eof = not chunk
+                buffer += chunk
+                continue
+            buffer = buffer[end:]
+            number += 1
+            if number > skip:
+                yield _checked(number, data, number)
+
+
+def read_records(path, offset=0, number=0):
+    """
+    SourceRecord для кожного запису, починаючи з позиції offset
+    (значення SourceRecord.offset останнього обробленого запису).
+    """
+    if path.lower().endswith(NDJSON_EXTENSIONS):
+        return _read_ndjson(path, offset, number)
+    return _read_json_array(path, offset)
+
+
+class ImportCheckpoint:
+    """Файл стану імпорту: позиція останнього завершеного пакета та лічильники"""
+
+    def __init__(self, state_path, source_path):
+        self.state_path = state_path
+        self.source_path = os.path.abspath(source_path)
+
+    def _fingerprint(self):
+        stat = os.stat(self.source_path)
+        return {'source': self.source_path, 'size': stat.st_size, 'mtime': stat.st_mtime}
+
+    def load(self):
+        """Збережений стан або None (немає файлу стану або джерело змінилось)"""
+        try:
+            with open(self.state_path, encoding='utf-8') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            logger.warning(f'Пошкоджений файл стану імпорту {self.state_path}, імпорт почнеться спочатку')
+            return None
+        if {key: state.get(key) for key in ('source', 'size', 'mtime')} != self._fingerprint():
+            logger.warning(f'Файл {self.source_path} змінився після перерваного імпорту, імпорт почнеться спочатку')
+            return None
+        return state
+
+    def save(self, offset, number, stats):
+        state = {**self._fingerprint(), 'offset': offset, 'number': number, 'stats': stats}
+        tmp_path = f'{self.state_path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        # Атомарна заміна: файл стану ніколи не буває записаним наполовину
+        os.replace(tmp_path, self.state_path)
+
+    def clear(self):
+        try:
+            os.remove(self.state_path)
+        except FileNotFoundError:
+            pass
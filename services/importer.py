@@ -0,0 +1,275 @@
+"""
+Пакетний імпорт статей
+
+Замість get_or_create/create/add на кожну статтю та тег:
+- автори, категорії та теги завантажуються у словники одним запитом на модель,
+  відсутні категорії й теги створюються одним bulk_create;
+- статті вставляються частинами (chunk_size) через bulk_create з уже
+  обчисленими slug, часом читання та датою публікації; зв'язки з тегами -
+  пакетною вставкою в проміжну таблицю; кожна частина - окрема транзакція
+  разом з її записами в пошуковому індексі;
+- сигнали моделей при цьому не надсилаються, тому кеш інвалідується, а схожі
+  статті перераховуються один раз в кінці імпорту.
+Повна заміна статей виконується через TRUNCATE/DELETE таблиць без
+каскадного видалення по одному об'єкту.
+"""
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from django.contrib.auth.models import User
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils.text import slugify
+from articles.models import Article, ArticleViewStat, Category, RelatedArticle, Tag, unidecode
+from services.cache import ARTICLE_NAMESPACES, NAVIGATION, bump
+from services.related import RelatedArticleService
+from services.search import get_search_backend
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 500
+
+# Порядок категорій у навігації
+CATEGORY_ORDER = {
+    'Новини': 1,
+    'Інтервʼю': 2,
+    'Рецензії': 3,
+    'Аналітика': 4,
+    'Добірки': 5,
+    'Авторські колонки': 6,
+}
+
+
+@dataclass
+class ImportResult:
+    """Підсумок імпорту"""
+    # (id, заголовок, дані статті) - для подальшого завантаження зображень
+    created: list = field(default_factory=list)
+    # статті, що вже існували: (id, заголовок, дані, чи є зображення)
+    existing: list = field(default_factory=list)
+    # (заголовок, текст помилки)
+    errors: list = field(default_factory=list)
+
+
+def make_slug(text, max_length):
+    return slugify(unidecode(text))[:max_length].strip('-')
+
+
+def parse_published_at(value):
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return timezone.now()
+
+
+class ArticleImportService:
+    """Пакетний імпорт статей, категорій і тегів"""
+
+    @staticmethod
+    def truncate():
+        """
+        Видалити всі статті разом з тегами статей, схожими та статистикою
+        переглядів. Повертає кількість видалених статей.
+        """
+        count = Article.objects.count()
+        tables = [
+            RelatedArticle._meta.db_table,
+            ArticleViewStat._meta.db_table,
+            Article.tags.through._meta.db_table,
+            Article._meta.db_table,
+        ]
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                for sql in connection.ops.sql_flush(no_style(), tables):
+                    cursor.execute(sql)
+            get_search_backend().clear()
+        bump(*ARTICLE_NAMESPACES)
+        logger.info(f'Видалено статей: {count}')
+        return count
+
+    @staticmethod
+    def _new_slugs(model, names):
+        """{назва: slug} для нових об'єктів; зайняті slug отримують суфікс -2, -3, ..."""
+        max_length = model._meta.get_field('slug').max_length
+        base = {name: make_slug(name, max_length) or model._meta.model_name for name in names}
+        taken = set(model.objects.filter(slug__in=set(base.values())).values_list('slug', flat=True))
+        checked = set()
+        result = {}
+        for name in names:
+            slug = candidate = base[name]
+            n = 2
+            while candidate in taken:
+                if slug not in checked:
+                    checked.add(slug)
+                    taken |= set(model.objects.filter(slug__startswith=f'{slug}-').values_list('slug', flat=True))
+                suffix = f'-{n}'
+                candidate = f'{slug[:max_length - len(suffix)]}{suffix}'
+                n += 1
+            taken.add(candidate)
+            result[name] = candidate
+        return result
+
+    @staticmethod
+    def load_categories(names):
+        """{назва: id}; відсутні категорії створюються, неактивні - активуються"""
+        names = set(names)
+        categories = {category.name: category for category in Category.objects.filter(name__in=names)}
+        missing = [name for name in names if name not in categories]
+        if missing:
+            slugs = ArticleImportService._new_slugs(Category, missing)
+            Category.objects.bulk_create([
+                Category(name=name, slug=slugs[name], is_active=True, order=CATEGORY_ORDER.get(name, 0))
+                for name in missing
+            ])
+            categories = {category.name: category for category in Category.objects.filter(name__in=names)}
+        inactive = [category for category in categories.values() if not category.is_active]
+        for category in inactive:
+            category.is_active = True
+            category.order = CATEGORY_ORDER.get(category.name, 0)
+        if inactive:
+            Category.objects.bulk_update(inactive, ['is_active', 'order'])
+        return {name: category.id for name, category in categories.items()}
+
+    @staticmethod
+    def load_tags(names):
+        """{назва: id}; відсутні теги створюються одним bulk_create"""
+        names = set(names)
+        tags = dict(Tag.objects.filter(name__in=names).values_list('name', 'id'))
+        missing = [name for name in names if name not in tags]
+        if missing:
+            slugs = ArticleImportService._new_slugs(Tag, missing)
+            objects = [Tag(name=name, slug=slugs[name]) for name in missing]
+            Tag.objects.bulk_create(objects, ignore_conflicts=True)
+            tags = dict(Tag.objects.filter(name__in=names).values_list('name', 'id'))
+        return tags
+
+    @staticmethod
+    def _build_article(data, author_id, category_id):
+        status = data.get('status', 'published')
+        published_at = parse_published_at(data['published_at']) if data.get('published_at') else None
+        if status == 'published' and not published_at:
+            published_at = timezone.now()
+        return Article(
+            title=data['title'],
+            slug=data.get('slug') or make_slug(data['title'], Article._meta.get_field('slug').max_length),
+            short_description=data['short_description'],
+            content=data['content'],
+            author_id=author_id,
+            category_id=category_id,
+            is_featured=data.get('is_featured', False),
+            status=status,
+            published_at=published_at,
+            meta_title=data.get('meta_title', ''),
+            meta_description=data.get('meta_description', ''),
+            reading_time=Article.estimate_reading_time(data['content']) if data['content'] else 0,
+        )
+
+    @staticmethod
+    def _import_chunk(chunk, result):
+        """Одна транзакція: статті, зв'язки з тегами та пошуковий індекс"""
+        slugs = [article.slug for article, _, _ in chunk]
+        existing = {
+            slug: (pk, bool(image))
+            for slug, pk, image in Article.objects.filter(slug__in=slugs).values_list('slug', 'id', 'featured_image')
+        }
+        new, seen = [], set()
+        for article, tag_ids, data in chunk:
+            if article.slug in existing:
+                pk, has_image = existing[article.slug]
+                result.existing.append((pk, article.title, data, has_image))
+            elif article.slug in seen:
+                result.errors.append((article.title, f'повторюваний slug "{article.slug}"'))
+            else:
+                seen.add(article.slug)
+                new.append((article, tag_ids, data))
+        if not new:
+            return []
+
+        with transaction.atomic():
+            Article.objects.bulk_create([article for article, _, _ in new])
+            ids = dict(Article.objects.filter(slug__in=list(seen)).values_list('slug', 'id'))
+            through = Article.tags.through
+            through.objects.bulk_create(
+                [
+                    through(article_id=ids[article.slug], tag_id=tag_id)
+                    for article, tag_ids, _ in new
+                    for tag_id in tag_ids
+                ],
+                ignore_conflicts=True,
+            )
+            get_search_backend().index([
+                (ids[article.slug], article.title, article.short_description, article.content)
+                for article, _, _ in new
+                if article.status == 'published'
+            ])
+
+        for article, _, data in new:
+            result.created.append((ids[article.slug], article.title, data))
+        return list(ids.values())
+
+    @staticmethod
+    def import_articles(articles_data, chunk_size=CHUNK_SIZE, rebuild_related=False, finish=True):
+        """
+        Імпортувати статті (словники у форматі import_articles).
+        Статті з уже наявним slug не змінюються і повертаються в result.existing.
+        finish=False - не викликати finish(): так імпортують пакетами,
+        викликаючи finish() один раз у кінці.
+        """
+        result = ImportResult()
+        authors = dict(
+            User.objects.filter(
+                username__in={data.get('author_username') for data in articles_data}
+            ).values_list('username', 'id')
+        )
+        categories = ArticleImportService.load_categories(
+            data['category'] for data in articles_data if data.get('category')
+        )
+        tags = ArticleImportService.load_tags(
+            name for data in articles_data for name in data.get('tags') or ()
+        )
+
+        prepared = []
+        for data in articles_data:
+            title = data.get('title', 'невідома')
+            author_id = authors.get(data.get('author_username'))
+            if author_id is None:
+                result.errors.append((title, f'автора "{data.get("author_username")}" не знайдено'))
+                continue
+            try:
+                article = ArticleImportService._build_article(data, author_id, categories.get(data.get('category')))
+            except KeyError as e:
+                result.errors.append((title, f'відсутнє поле {e}'))
+                continue
+            tag_ids = list(dict.fromkeys(tags[name] for name in data.get('tags') or () if name in tags))
+            prepared.append((article, tag_ids, data))
+
+        created_ids = []
+        for start in range(0, len(prepared), chunk_size):
+            chunk = prepared[start:start + chunk_size]
+            try:
+                created_ids += ArticleImportService._import_chunk(chunk, result)
+            except Exception as e:
+                logger.exception('Помилка імпорту частини статей')
+                result.errors += [(article.title, str(e)) for article, _, _ in chunk]
+
+        if finish:
+            ArticleImportService.finish(created_ids, rebuild_related)
+        logger.info(
+            f'Імпорт статей: створено {len(result.created)}, існуючих {len(result.existing)}, '
+            f'помилок {len(result.errors)}'
+        )
+        return result
+
+    @staticmethod
+    def finish(created_ids, rebuild_related=False):
+        """
+        Схожі статті та інвалідація кешу після імпорту.
+        rebuild_related - повністю перерахувати схожі статті (після truncate),
+        інакше перераховуються лише зачеплені новими статтями.
+        """
+        if rebuild_related:
+            RelatedArticleService.rebuild_all()
+        elif created_ids:
+            RelatedArticleService.update_for(created_ids)
+        bump(*ARTICLE_NAMESPACES, NAVIGATION)
@@ -0,0 +1,240 @@
+"""
+Префіксний індекс для live search
+
+Кожен воркер тримає в пам'яті компактний індекс опублікованих статей:
+префікси слів заголовка та короткого опису (edge n-grams) -> {id статті: вага}.
+Запит відповідає перетином кількох словників без звернення до БД.
+
+Індекс будується ліниво у фоновому потоці при першому запиті (поки він
+холодний, відповідає БД) і оновлюється інкрементально: коли змінюється
+покоління кешу статей, з БД вибираються лише рядки з updated_at після
+останньої відомої позначки.
+"""
+import time
+import heapq
+import logging
+import threading
+from django.db import connections
+from django.db.models import Q
+from django.urls import reverse
+from articles.models import Article, Category
+from services.cache import LATEST, get_generation
+from services.search import TOKEN_RE, normalize
+
+logger = logging.getLogger(__name__)
+
+MIN_PREFIX = 2
+MAX_PREFIX = 12
+RESULTS_LIMIT = 5
+DESCRIPTION_PREVIEW = 100
+# Як часто перевіряти покоління кешу статей, секунд
+CHECK_INTERVAL = 2.0
+
+TITLE_WEIGHT = 3
+DESCRIPTION_WEIGHT = 1
+
+
+def _prefixes(text, weight):
+    """Префікси всіх слів тексту з вагою поля"""
+    result = {}
+    for token in TOKEN_RE.findall(normalize(text)):
+        for length in range(MIN_PREFIX, min(len(token), MAX_PREFIX) + 1):
+            result[token[:length]] = weight
+    return result
+
+
+def _preview(text):
+    text = text or ''
+    return text[:DESCRIPTION_PREVIEW] + '...' if len(text) > DESCRIPTION_PREVIEW else text
+
+
+class LiveSearchIndex:
+    """Префіксний індекс статей у пам'яті воркера"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}    # id -> (title, url, description, category_id, published_ts, prefixes)
+        self._postings = {}   # префікс -> {id: вага}
+        self._categories = {}
+        self._watermark = None
+        self._generation = None
+        self._last_check = 0.0
+        self._ready = False
+        self._updating = False
+
+    # ---------- Побудова та оновлення ----------
+
+    @staticmethod
+    def _rows(queryset):
+        return queryset.values_list(
+            'id', 'slug', 'title', 'short_description', 'category_id', 'published_at', 'updated_at', 'status'
+        )
+
+    def _add(self, row):
+        pk, slug, title, description, category_id, published_at, _, _ = row
+        words = _prefixes(description, DESCRIPTION_WEIGHT)
+        words.update(_prefixes(title, TITLE_WEIGHT))
+        self._entries[pk] = (
+            title,
+            reverse('articles:article_detail', kwargs={'slug': slug}),
+            description or '',
+            category_id,
+            published_at.timestamp() if published_at else 0.0,
+            tuple(words),
+        )
+        for prefix, weight in words.items():
+            self._postings.setdefault(prefix, {})[pk] = weight
+
+    def _remove(self, pk):
+        entry = self._entries.pop(pk, None)
+        if entry is None:
+            return
+        for prefix in entry[5]:
+            posting = self._postings.get(prefix)
+            if posting is not None:
+                posting.pop(pk, None)
+                if not posting:
+                    del self._postings[prefix]
+
+    def _categories_map(self):
+        return dict(Category.objects.values_list('id', 'name'))
+
+    def build(self):
+        """Повна побудова індексу"""
+        generation = get_generation(LATEST)
+        rows = list(self._rows(Article.objects.filter(status='published')))
+        categories = self._categories_map()
+        with self._lock:
+            self._entries = {}
+            self._postings = {}
+            for row in rows:
+                self._add(row)
+            self._categories = categories
+            self._watermark = max((row[6] for row in rows), default=None)
+            self._generation = generation
+            self._ready = True
+        logger.info(f'Live search: проіндексовано {len(rows)} статей, префіксів: {len(self._postings)}')
+
+    def refresh(self):
+        """Інкрементальне оновлення за позначкою updated_at"""
+        generation = get_generation(LATEST)
+        changed = self._rows(Article.objects.all())
+        if self._watermark is not None:
+            changed = changed.filter(updated_at__gte=self._watermark)
+        changed = list(changed)
+        # Видалені статті не мають updated_at, тому звіряємо множину id
+        published_ids = set(Article.objects.filter(status='published').values_list('id', flat=True))
+        categories = self._categories_map()
+
+        with self._lock:
+            for row in changed:
+                self._remove(row[0])
+                if row[7] == 'published':
+                    self._add(row)
+            for pk in set(self._entries) - published_ids:
+                self._remove(pk)
+            self._categories = categories
+            if changed:
+                self._watermark = max([row[6] for row in changed] + ([self._watermark] if self._watermark else []))
+            self._generation = generation
+        logger.debug(f'Live search: оновлено {len(changed)} статей')
+
+    def _run_update(self, method):
+        try:
+            method()
+        except Exception as e:
+            logger.error(f'Помилка оновлення індексу live search: {e}')
+        finally:
+            self._updating = False
+            connections.close_all()
+
+    def _schedule(self, method):
+        with self._lock:
+            if self._updating:
+                return
+            self._updating = True
+        threading.Thread(target=self._run_update, args=(method,), daemon=True).start()
+
+    def _ensure_fresh(self):
+        """True, якщо індекс готовий відповідати (можливо, трохи застарілий)"""
+        if not self._ready:
+            self._schedule(self.build)
+            return False
+        now = time.monotonic()
+        if now - self._last_check >= CHECK_INTERVAL:
+            self._last_check = now
+            try:
+                if get_generation(LATEST) != self._generation:
+                    self._schedule(self.refresh)
+            except Exception as e:
+                logger.warning(f'Не вдалося перевірити покоління кешу статей: {e}')
+        return True
+
+    # ---------- Пошук ----------
+
+    def lookup(self, query, limit=RESULTS_LIMIT):
+        """Пошук в індексі: найкращі limit статей за вагою збігів та свіжістю"""
+        tokens = [token for token in TOKEN_RE.findall(normalize(query)) if len(token) >= MIN_PREFIX]
+        if not tokens:
+            return []
+
+        with self._lock:
+            postings = [self._postings.get(token[:MAX_PREFIX], {}) for token in tokens]
+            postings.sort(key=len)
+            scores = {}
+            for pk, weight in postings[0].items():
+                score = weight
+                for posting in postings[1:]:
+                    other = posting.get(pk)
+                    if other is None:
+                        break
+                    score += other
+                else:
+                    scores[pk] = score
+
+            long_tokens = [token for token in tokens if len(token) > MAX_PREFIX]
+            if long_tokens:
+                # Префікси обрізані до MAX_PREFIX - перевіряємо довгі слова повністю
+                scores = {
+                    pk: score for pk, score in scores.items()
+                    if all(self._matches(pk, token) for token in long_tokens)
+                }
+
+            best = heapq.nlargest(limit, scores, key=lambda pk: (scores[pk], self._entries[pk][4]))
+            return [self._result(pk) for pk in best]
+
+    def _matches(self, pk, token):
+        title, _, description, *_ = self._entries[pk]
+        return any(word.startswith(token) for word in TOKEN_RE.findall(normalize(f'{title} {description}')))
+
+    def _result(self, pk):
+        title, url, description, category_id, *_ = self._entries[pk]
+        return {
+            'title': title,
+            'url': url,
+            'short_description': _preview(description),
+            'category': self._categories.get(category_id, ''),
+        }
+
+    def search(self, query, limit=RESULTS_LIMIT):
+        """Результати live search; поки індекс не побудовано - запит до БД"""
+        if self._ensure_fresh():
+            return self.lookup(query, limit)
+        return database_search(query, limit)
+
+
+def database_search(query, limit=RESULTS_LIMIT):
+    """Запасний пошук через icontains"""
+    articles = Article.objects.filter(
+        Q(title__icontains=query) | Q(short_description__icontains=query),
+        status='published'
+    ).select_related('category')[:limit]
+    return [{
+        'title': article.title,
+        'url': article.get_absolute_url(),
+        'short_description': _preview(article.short_description),
+        'category': article.category.name if article.category else '',
+    } for article in articles]
+
+
+live_search_index = LiveSearchIndex()
@@ -0,0 +1,73 @@
+"""
+Реєстр завантажених медіафайлів, адресованих вмістом
+
+Перед завантаженням у storage рахується sha256 байтів файлу. Якщо такий
+вміст уже зберігався, повертається ім'я (public_id) наявного ресурсу і
+повторного завантаження не відбувається. URL джерела (імпорт) теж
+реєструється, тому знайоме посилання не потрібно навіть завантажувати.
+"""
+import hashlib
+import logging
+from articles.models import MediaAsset
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(content):
+    """sha256 вмісту файлу (позиція читання повертається на початок)"""
+    digest = hashlib.sha256()
+    if hasattr(content, 'seek'):
+        content.seek(0)
+    for chunk in content.chunks():
+        digest.update(chunk)
+    if hasattr(content, 'seek'):
+        content.seek(0)
+    return digest.hexdigest()
+
+
+class MediaAssetService:
+    """Дедуплікація файлів у storage за sha256"""
+
+    @staticmethod
+    def names_for_urls(urls):
+        """{URL джерела: ім'я в storage} для вже завантажених посилань"""
+        urls = {url for url in urls if url}
+        if not urls:
+            return {}
+        return dict(MediaAsset.objects.filter(source_url__in=urls).values_list('source_url', 'name'))
+
+    @staticmethod
+    def _register(digest, source_url, name, size):
+        MediaAsset.objects.bulk_create(
+            [MediaAsset(sha256=digest, source_url=source_url, name=name, size=size)],
+            ignore_conflicts=True,
+        )
+
+    @staticmethod
+    def save(storage, name, content, max_length, upload):
+        """
+        Зберегти content через upload(name, content, max_length), якщо такого
+        вмісту ще немає в реєстрі; повертає ім'я файлу в storage.
+        content.source_url (якщо є) - URL, з якого файл завантажено.
+        """
+        digest = content_hash(content)
+        source_url = getattr(content, 'source_url', '') or ''
+        existing = MediaAsset.objects.filter(sha256=digest).order_by('id').values_list('name', flat=True).first()
+        if existing:
+            if source_url:
+                MediaAssetService._register(digest, source_url, existing, content.size)
+            logger.debug(f'Файл {name} вже збережено як {existing}')
+            return existing
+
+        stored = upload(name, content, max_length)
+        MediaAssetService._register(digest, source_url, stored, content.size)
+        # Той самий вміст міг паралельно завантажитись в іншому потоці:
+        # залишаємо найперший запис, а свою копію видаляємо
+        first = MediaAsset.objects.filter(sha256=digest).order_by('id').values_list('name', flat=True).first()
+        if first != stored:
+            MediaAsset.objects.filter(sha256=digest, name=stored).update(name=first)
+            try:
+                storage.delete(stored)
+            except Exception as e:
+                logger.warning(f'Не вдалося видалити дублікат {stored}: {e}')
+        return first
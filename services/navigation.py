@@ -0,0 +1,58 @@
+"""
+Навігаційні категорії
+
+Список категорій для меню та футера зберігається в кожному процесі як
+незмінний кортеж і перебудовується лише тоді, коли сигнал збереження
+або видалення категорії збільшує покоління NAVIGATION.
+"""
+import logging
+import threading
+from collections import namedtuple
+from django.db import DatabaseError
+from django.urls import reverse
+from articles.models import Category
+from services.cache import NAVIGATION, get_generation, make_key, get_or_compute
+
+logger = logging.getLogger(__name__)
+
+NAVIGATION_CACHE_TIMEOUT = 60 * 60 * 24  # 1 день
+
+
+class NavCategory(namedtuple('NavCategory', ['slug', 'name', 'url'])):
+    """Категорія в навігації"""
+    __slots__ = ()
+
+    def get_absolute_url(self):
+        return self.url
+
+
+class NavigationService:
+    """Знімок навігаційних категорій на рівні процесу"""
+
+    _lock = threading.Lock()
+    _snapshot = ()
+    _generation = None
+
+    @staticmethod
+    def _build():
+        return tuple(
+            NavCategory(slug, name, reverse('articles:category_detail', kwargs={'slug': slug}))
+            for slug, name in Category.objects.filter(is_active=True).order_by('order', 'name').values_list('slug', 'name')
+        )
+
+    @classmethod
+    def get_categories(cls):
+        """Активні категорії як кортеж NavCategory"""
+        try:
+            generation = get_generation(NAVIGATION)
+            if generation == cls._generation:
+                return cls._snapshot
+            snapshot = get_or_compute(make_key(NAVIGATION, 'categories'), cls._build, NAVIGATION_CACHE_TIMEOUT)
+        except DatabaseError as e:
+            # Таблиці ще не створені (перший деплой) - навігація без категорій
+            logger.warning(f'Не вдалося завантажити категорії навігації: {e}')
+            return ()
+        with cls._lock:
+            cls._snapshot = snapshot
+            cls._generation = generation
+        return snapshot
@@ -0,0 +1,137 @@
+"""
+Пагінація списків статей
+
+KeysetPaginator - курсорна пагінація за (published_at, id) без COUNT(*) та OFFSET:
+кожна сторінка - це індексний діапазон після/перед ключем останнього/першого
+елемента попередньої сторінки, тому глибокі сторінки не повільніші за першу.
+
+CachedCountPaginator - класична пагінація за номерами сторінок
+із закешованою (наближеною, до TTL) кількістю записів.
+"""
+import json
+import base64
+import binascii
+from django.core.paginator import Paginator
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
+from services.cache import LISTING, make_key, get_or_compute
+
+COUNT_CACHE_TIMEOUT = 60 * 60  # 1 година
+
+NEXT = 'n'
+PREVIOUS = 'p'
+
+
+def encode_cursor(published_at, pk, direction):
+    """Непрозорий курсор для URL"""
+    raw = json.dumps([published_at.isoformat(), pk, direction], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Розібрати курсор; для пошкодженого курсору повертає None"""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        published_at, pk, direction = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        published_at = parse_datetime(published_at)
+        if published_at is None or direction not in (NEXT, PREVIOUS):
+            return None
+        return published_at, int(pk), direction
+    except (ValueError, TypeError, binascii.Error):
+        return None
+
+
+class KeysetPage:
+    """Сторінка курсорної пагінації (без загальної кількості)"""
+
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __repr__(self):
+        return f'<KeysetPage of {len(self.object_list)} items>'
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+    """
+    Курсорна пагінація статей у порядку від новіших до старіших.
+    Використовує індекс (-published_at, status).
+    """
+
+    def __init__(self, queryset, per_page):
+        self.queryset = queryset
+        self.per_page = int(per_page)
+
+    def get_page(self, cursor=None):
+        decoded = decode_cursor(cursor)
+        if decoded is None:
+            rows = list(self.queryset.order_by('-published_at', '-id')[:self.per_page + 1])
+            return self._page(rows[:self.per_page], has_next=len(rows) > self.per_page, has_previous=False)
+
+        published_at, pk, direction = decoded
+        if direction == NEXT:
+            rows = list(
+                self.queryset.filter(
+                    Q(published_at__lt=published_at) | Q(published_at=published_at, id__lt=pk)
+                ).order_by('-published_at', '-id')[:self.per_page + 1]
+            )
+            return self._page(rows[:self.per_page], has_next=len(rows) > self.per_page, has_previous=True)
+
+        rows = list(
+            self.queryset.filter(
+                Q(published_at__gt=published_at) | Q(published_at=published_at, id__gt=pk)
+            ).order_by('published_at', 'id')[:self.per_page + 1]
+        )
+        has_previous = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        rows.reverse()
+        return self._page(rows, has_next=True, has_previous=has_previous)
+
+    @staticmethod
+    def _page(rows, has_next, has_previous):
+        next_cursor = None
+        previous_cursor = None
+        if rows and has_next:
+            next_cursor = encode_cursor(rows[-1].published_at, rows[-1].id, NEXT)
+        if rows and has_previous:
+            previous_cursor = encode_cursor(rows[0].published_at, rows[0].id, PREVIOUS)
+        return KeysetPage(rows, next_cursor, previous_cursor)
+
+
+class CachedCountPaginator(Paginator):
+    """Paginator, що кешує COUNT(*) для списку під ключем count_key"""
+
+    def __init__(self, object_list, per_page, count_key, timeout=COUNT_CACHE_TIMEOUT, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_key = count_key
+        self.timeout = timeout
+
+    @cached_property
+    def count(self):
+        return get_or_compute(
+            make_key(LISTING, 'count', self.count_key),
+            lambda: Paginator.count.func(self),
+            self.timeout,
+        )
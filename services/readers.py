@@ -0,0 +1,90 @@
+"""
+Унікальні читачі статей
+
+Для кожної статті та дня в ArticleViewStat.readers зберігається скетч
+HyperLogLog (services/hll.py) ідентифікаторів відвідувачів. Ідентифікатор -
+це хеш IP та User-Agent із SECRET_KEY; у скетч потрапляють лише біти хешу,
+тому самі відвідувачі ніде не зберігаються. Кількість читачів за 7/30 днів -
+об'єднання денних скетчів, а розмір даних не залежить від трафіку.
+"""
+import re
+import hashlib
+import logging
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from articles.models import Article, ArticleViewStat
+from services.cache import LISTING, make_key, get_or_compute
+from services.hll import HyperLogLog
+
+logger = logging.getLogger(__name__)
+
+READER_PERIODS = (7, 30)
+READERS_CACHE_TIMEOUT = 60 * 10  # 10 хвилин
+
+BOT_RE = re.compile(
+    r'bot|crawl|spider|slurp|facebookexternalhit|preview|curl|wget|python-requests|httpclient|headless',
+    re.IGNORECASE,
+)
+
+
+def visitor_id(request):
+    """
+    Анонімний ідентифікатор відвідувача (однаковий у різні дні, інакше
+    об'єднання денних скетчів рахувало б постійного читача кілька разів).
+    Для ботів повертає None - вони не враховуються як читачі.
+    """
+    user_agent = request.META.get('HTTP_USER_AGENT', '')
+    if not user_agent or BOT_RE.search(user_agent):
+        return None
+    forwarded = request.META.get('HTTP_X_FORWARDED_FOR', '')
+    ip = forwarded.split(',')[0].strip() if forwarded else request.META.get('REMOTE_ADDR', '')
+    raw = f'{settings.SECRET_KEY}|{ip}|{user_agent}'
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+class UniqueReaderService:
+    """Денні скетчі унікальних читачів"""
+
+    @staticmethod
+    def record_sketches(sketches, date=None):
+        """Злити скетчі {article_id: HyperLogLog} з денними скетчами в БД"""
+        if not sketches:
+            return
+        date = date or timezone.localdate()
+        existing = set(Article.objects.filter(id__in=list(sketches)).values_list('id', flat=True))
+        with transaction.atomic():
+            ArticleViewStat.objects.bulk_create(
+                [ArticleViewStat(article_id=pk, date=date, views=0) for pk in sketches if pk in existing],
+                ignore_conflicts=True,
+            )
+            # select_for_update: паралельні скидання зливаються, а не перезаписують одне одного
+            stats = list(
+                ArticleViewStat.objects.select_for_update().filter(date=date, article_id__in=list(sketches))
+            )
+            for stat in stats:
+                sketch = sketches[stat.article_id]
+                if stat.readers:
+                    sketch = HyperLogLog.from_bytes(stat.readers).merge(sketch)
+                stat.readers = sketch.to_bytes()
+            ArticleViewStat.objects.bulk_update(stats, ['readers'])
+
+    @staticmethod
+    def count_readers(article_id, days, today=None):
+        """Наближена кількість унікальних читачів за останні days днів"""
+        today = today or timezone.localdate()
+        sketches = ArticleViewStat.objects.filter(
+            article_id=article_id,
+            date__gt=today - timedelta(days=days),
+            readers__isnull=False,
+        ).values_list('readers', flat=True)
+        return HyperLogLog.union(HyperLogLog.from_bytes(data) for data in sketches).count()
+
+    @staticmethod
+    def get_reader_stats(article_id):
+        """{днів: кількість читачів} для READER_PERIODS, з кешем"""
+        def compute():
+            return {days: UniqueReaderService.count_readers(article_id, days) for days in READER_PERIODS}
+
+        return get_or_compute(make_key(LISTING, 'readers', article_id), compute, READERS_CACHE_TIMEOUT)
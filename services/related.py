@@ -0,0 +1,150 @@
+"""
+Матеріалізовані схожі статті
+
+Оцінка схожості двох опублікованих статей:
+- зважений коефіцієнт Жаккара за тегами (рідкісні теги важать більше, вага = IDF);
+- бонус за спільну категорію;
+- бонус за свіжість кандидата (експоненційне згасання з періодом напіврозпаду).
+
+Для кожної статті зберігається RELATED_LIMIT найкращих кандидатів у таблиці
+RelatedArticle, тому сторінка статті читає кілька рядків за індексом
+(article, -score) замість JOIN з тегами та DISTINCT.
+"""
+import math
+import logging
+from collections import defaultdict
+from django.db import transaction
+from django.utils import timezone
+from articles.models import Article, RelatedArticle
+
+logger = logging.getLogger(__name__)
+
+# Скільки схожих статей зберігати для кожної (з запасом для сторінки)
+RELATED_LIMIT = 8
+TAG_WEIGHT = 1.0
+CATEGORY_WEIGHT = 0.3
+RECENCY_WEIGHT = 0.2
+RECENCY_HALF_LIFE_DAYS = 90
+
+
+class Corpus:
+    """Теги, категорії та дати опублікованих статей з інвертованими індексами"""
+
+    def __init__(self, articles, article_tags, now=None):
+        # articles: (id, category_id, published_at); article_tags: (article_id, tag_id)
+        self.now = now or timezone.now()
+        self.categories = {}
+        self.published = {}
+        self.tags = defaultdict(set)
+        self.by_tag = defaultdict(set)
+        self.by_category = defaultdict(set)
+
+        for pk, category_id, published_at in articles:
+            self.categories[pk] = category_id
+            self.published[pk] = published_at
+            if category_id is not None:
+                self.by_category[category_id].add(pk)
+        for pk, tag_id in article_tags:
+            if pk in self.categories:
+                self.tags[pk].add(tag_id)
+                self.by_tag[tag_id].add(pk)
+
+        total = max(len(self.categories), 1)
+        self.idf = {tag_id: math.log(1 + total / len(ids)) for tag_id, ids in self.by_tag.items()}
+
+    def _recency(self, pk):
+        published_at = self.published.get(pk)
+        if published_at is None:
+            return 0.0
+        age_days = max((self.now - published_at).total_seconds() / 86400, 0.0)
+        return 0.5 ** (age_days / RECENCY_HALF_LIFE_DAYS)
+
+    def _tag_similarity(self, tags, other_tags):
+        shared = tags & other_tags
+        if not shared:
+            return 0.0
+        union = sum(self.idf[tag_id] for tag_id in tags | other_tags)
+        return sum(self.idf[tag_id] for tag_id in shared) / union
+
+    def neighbours(self, pk):
+        """Статті, що мають з pk спільний тег або категорію"""
+        result = set()
+        for tag_id in self.tags.get(pk, ()):
+            result |= self.by_tag[tag_id]
+        category_id = self.categories.get(pk)
+        if category_id is not None:
+            result |= self.by_category[category_id]
+        result.discard(pk)
+        return result
+
+    def score(self, pk, other):
+        score = TAG_WEIGHT * self._tag_similarity(self.tags.get(pk, set()), self.tags.get(other, set()))
+        category_id = self.categories.get(pk)
+        if category_id is not None and category_id == self.categories.get(other):
+            score += CATEGORY_WEIGHT
+        return score + RECENCY_WEIGHT * self._recency(other)
+
+    def top_related(self, pk, limit=RELATED_LIMIT):
+        """Найкращі (related_id, score) для статті"""
+        if pk not in self.categories:
+            return []
+        scored = [(self.score(pk, other), other) for other in self.neighbours(pk)]
+        scored.sort(key=lambda item: (-item[0], -item[1]))
+        return [(other, score) for score, other in scored[:limit]]
+
+
+class RelatedArticleService:
+    """Перерахунок таблиці RelatedArticle"""
+
+    @staticmethod
+    def load_corpus(article_model=Article, using='default'):
+        articles = article_model.objects.using(using).filter(
+            status='published'
+        ).values_list('id', 'category_id', 'published_at')
+        article_tags = article_model.tags.through.objects.using(using).values_list('article_id', 'tag_id')
+        return Corpus(list(articles), list(article_tags))
+
+    @staticmethod
+    def _store(corpus, ids, related_model=RelatedArticle, using='default'):
+        rows = [
+            related_model(article_id=pk, related_id=other, score=score)
+            for pk in ids
+            for other, score in corpus.top_related(pk)
+        ]
+        with transaction.atomic(using=using):
+            related_model.objects.using(using).filter(article_id__in=ids).delete()
+            related_model.objects.using(using).bulk_create(rows, batch_size=500)
+        return len(rows)
+
+    @staticmethod
+    def rebuild_all(article_model=Article, related_model=RelatedArticle, using='default'):
+        """Повний перерахунок для всіх опублікованих статей"""
+        corpus = RelatedArticleService.load_corpus(article_model, using)
+        with transaction.atomic(using=using):
+            related_model.objects.using(using).all().delete()
+            count = RelatedArticleService._store(corpus, list(corpus.categories), related_model, using)
+        logger.info(f'Схожі статті: {count} зв\'язків для {len(corpus.categories)} статей')
+        return count
+
+    @staticmethod
+    def update_for(article_ids):
+        """
+        Інкрементальний перерахунок після зміни статей article_ids:
+        самі статті, їх сусіди за тегами/категорією та статті, що на них посилались
+        """
+        article_ids = set(article_ids)
+        corpus = RelatedArticleService.load_corpus()
+        affected = set(article_ids)
+        for pk in article_ids:
+            affected |= corpus.neighbours(pk)
+        affected |= set(
+            RelatedArticle.objects.filter(related_id__in=article_ids).values_list('article_id', flat=True)
+        )
+        count = RelatedArticleService._store(corpus, affected)
+        logger.debug(f'Схожі статті: перераховано {len(affected)} статей ({count} зв\'язків)')
+
+    @staticmethod
+    def update_on_commit(*article_ids):
+        if not article_ids:
+            return
+        transaction.on_commit(lambda: RelatedArticleService.update_for(article_ids))
@@ -0,0 +1,80 @@
+"""
+Адаптивні зображення: srcset/sizes для карток, головної, сторінки статті та аватарів
+
+Варіанти різної ширини не зберігаються окремо: Cloudinary створює їх на льоту
+за URL з трансформацією і кешує на CDN. Трансформація кадрує зображення під
+пропорції місця на сторінці (c_fill, g_auto), а f_auto/q_auto віддають AVIF або
+WebP браузерам, що їх підтримують, і JPEG/PNG решті. URL варіанта залежить
+лише від оригінального URL і ширини, тому однаковий для всіх сторінок і
+кешується браузером та CDN. Для зображень не з Cloudinary повертається
+оригінальний URL без srcset.
+"""
+from collections import namedtuple
+from functools import lru_cache
+
+CLOUDINARY_HOST = 'res.cloudinary.com'
+CLOUDINARY_UPLOAD_SEGMENT = '/image/upload/'
+RESPONSIVE_CACHE_SIZE = 4096
+
+# widths - драбина ширин для srcset; ratio - пропорції (ширина, висота);
+# src_width - ширина варіанта для src (браузери без srcset) та атрибутів width/height;
+# sizes - ширина місця на сторінці (відповідає сітці в static/css/main.css)
+ImagePreset = namedtuple('ImagePreset', ['widths', 'ratio', 'src_width', 'sizes'])
+
+PRESETS = {
+    # Картка: 1 колонка до 640px, 2 - до 1024px, далі 3 колонки контейнера 1152px
+    'card': ImagePreset(
+        (320, 480, 640, 960), (16, 9), 640,
+        '(min-width: 1024px) 370px, (min-width: 640px) 50vw, 100vw',
+    ),
+    # Головна стаття на головній сторінці (.featured-image 400x240)
+    'hero': ImagePreset((400, 640, 800), (5, 3), 800, '(min-width: 448px) 400px, 100vw'),
+    # Зображення на сторінці статті (колонка 768px)
+    'detail': ImagePreset(
+        (320, 640, 960, 1280, 1536), (3, 2), 1280,
+        '(min-width: 816px) 768px, 100vw',
+    ),
+    # Аватар автора (.author-avatar 150x150)
+    'avatar': ImagePreset((150, 300), (1, 1), 300, '150px'),
+}
+
+ResponsiveImage = namedtuple('ResponsiveImage', ['src', 'srcset', 'sizes', 'width', 'height'])
+
+
+def is_transformable(url):
+    return bool(url) and CLOUDINARY_HOST in url and CLOUDINARY_UPLOAD_SEGMENT in url
+
+
+def variant_url(url, width, height):
+    """URL варіанта зображення заданого розміру (трансформація Cloudinary)"""
+    transformation = f'c_fill,g_auto,w_{width},h_{height},f_auto,q_auto'
+    return url.replace(CLOUDINARY_UPLOAD_SEGMENT, f'{CLOUDINARY_UPLOAD_SEGMENT}{transformation}/', 1)
+
+
+def thumbnail_url(url, size):
+    """URL зменшеної копії зі збереженням пропорцій (не більше size по більшій стороні)"""
+    if not is_transformable(url):
+        return url
+    return url.replace(CLOUDINARY_UPLOAD_SEGMENT, f'{CLOUDINARY_UPLOAD_SEGMENT}c_limit,w_{size},h_{size}/', 1)
+
+
+@lru_cache(maxsize=RESPONSIVE_CACHE_SIZE)
+def responsive_image(url, preset_name):
+    """ResponsiveImage для URL зображення за пресетом з PRESETS"""
+    preset = PRESETS[preset_name]
+    if not is_transformable(url):
+        return ResponsiveImage(url, '', '', None, None)
+
+    ratio_width, ratio_height = preset.ratio
+
+    def height(width):
+        return round(width * ratio_height / ratio_width)
+
+    srcset = ', '.join(f'{variant_url(url, width, height(width))} {width}w' for width in preset.widths)
+    return ResponsiveImage(
+        src=variant_url(url, preset.src_width, height(preset.src_width)),
+        srcset=srcset,
+        sizes=preset.sizes,
+        width=preset.src_width,
+        height=height(preset.src_width),
+    )
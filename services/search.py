@@ -0,0 +1,413 @@
+"""
+Повнотекстовий пошук статей
+
+Бекенд обирається за типом БД:
+- PostgreSQL: таблиця articles_search_index з tsvector та GIN-індексом;
+- SQLite: віртуальна таблиця FTS5 articles_search_fts;
+- інші БД (або SQLite без FTS5): запасний пошук через icontains.
+
+Текст нормалізується та стемується для української мови тут, у Python,
+тому обидва бекенди використовують однакову морфологію ('simple' конфігурація
+у PostgreSQL, unicode61 у FTS5). Вага полів: заголовок > короткий опис > контент.
+Індекс підтримується інкрементально сигналами збереження/видалення статті.
+"""
+import re
+import logging
+from functools import lru_cache
+from django.db import connection, DatabaseError
+from django.db.models import Q
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+
+logger = logging.getLogger(__name__)
+
+SQLITE_TABLE = 'articles_search_fts'
+POSTGRES_TABLE = 'articles_search_index'
+
+# Ваги полів (заголовок, короткий опис, контент)
+SQLITE_WEIGHTS = (10.0, 4.0, 1.0)
+
+MIN_STEM_LENGTH = 3
+# Максимальна кількість слів запиту
+MAX_QUERY_TERMS = 8
+SNIPPET_LENGTH = 200
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+CYRILLIC_RE = re.compile(r'[а-яіїєґ]')
+APOSTROPHES = str.maketrans('', '', "'ʼ’`‘")
+
+# Закінчення українських слів (іменники, прикметники, дієслова), від довших до коротших
+UKRAINIAN_SUFFIXES = sorted({
+    # дієслова
+    'ються', 'ується', 'ється', 'иться', 'ться', 'ували',
+    'ують', 'ють', 'ать', 'ять', 'уть', 'ити', 'ати', 'яти', 'іти', 'ти',
+    'ував', 'ала', 'ало', 'али', 'ила', 'ило', 'или', 'ла', 'ло', 'ли',
+    'ємо', 'ете', 'єте', 'емо', 'имо', 'ите', 'ує', 'ює',
+    # прикметники
+    'ього', 'ьому', 'ого', 'ому', 'ими', 'іми', 'ої', 'ою', 'ій', 'ий',
+    'им', 'их', 'ім', 'іх', 'ая', 'яя', 'ее', 'ие', 'ні', 'ня',
+    # іменники
+    'ами', 'ями', 'ові', 'еві', 'єві', 'ією', 'ах', 'ях', 'ом', 'ем', 'єм',
+    'ею', 'єю', 'ів', 'їв', 'ей', 'ам', 'ям', 'ія', 'ії', 'ію', 'ья',
+    'а', 'я', 'о', 'е', 'є', 'у', 'ю', 'і', 'и', 'ї', 'ь', 'й',
+}, key=len, reverse=True)
+
+
+def normalize(text):
+    """Нижній регістр, без апострофів та наголосів"""
+    return (text or '').lower().translate(APOSTROPHES).replace('́', '')
+
+
+# Словник обмежений, тому основи кешуються (важливо для пакетної індексації)
+@lru_cache(maxsize=100_000)
+def stem(token):
+    """Легкий стемер: відкидає типове закінчення, залишаючи основу від 3 літер"""
+    if not CYRILLIC_RE.search(token):
+        return token
+    for suffix in UKRAINIAN_SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= MIN_STEM_LENGTH:
+            return token[:-len(suffix)]
+    return token
+
+
+def analyze(text):
+    """Список основ слів тексту"""
+    return [stem(token) for token in TOKEN_RE.findall(normalize(text))]
+
+
+def analyzed_text(text):
+    return ' '.join(analyze(text))
+
+
+def query_terms(query):
+    """
+    Основи слів запиту для префіксного пошуку.
+    Довгі основи трохи вкорочуються, бо стемер може відрізати від слова
+    в документі більше, ніж від слова в запиті ('альбом' → 'альб').
+    """
+    terms = []
+    for term in analyze(query)[:MAX_QUERY_TERMS]:
+        if len(term) >= 6 and CYRILLIC_RE.search(term):
+            term = term[:-2]
+        if term not in terms:
+            terms.append(term)
+    return terms
+
+
+def highlight(text, terms, length=SNIPPET_LENGTH):
+    """
+    Фрагмент тексту навколо першого збігу з підсвіченими словами (<mark>).
+    Повертає None, якщо в тексті немає збігів.
+    """
+    text = text or ''
+    matches = [
+        match for match in TOKEN_RE.finditer(text)
+        if any(stem(normalize(match.group())).startswith(term) for term in terms)
+    ]
+    if not matches:
+        return None
+
+    start = max(0, matches[0].start() - length // 4)
+    # Починаємо фрагмент з початку слова
+    if start:
+        space = text.find(' ', start)
+        start = space + 1 if 0 <= space < matches[0].start() else matches[0].start()
+    end = min(len(text), start + length)
+
+    parts = ['…' if start else '']
+    position = start
+    for match in matches:
+        if match.start() < start or match.end() > end:
+            continue
+        parts.append(escape(text[position:match.start()]))
+        parts.append(f'<mark>{escape(match.group())}</mark>')
+        position = match.end()
+    parts.append(escape(text[position:end]))
+    if end < len(text):
+        parts.append('…')
+    return mark_safe(''.join(parts))
+
+
+def make_snippet(article, terms):
+    """Фрагмент з короткого опису або контенту статті"""
+    return (
+        highlight(article.short_description, terms)
+        or highlight(article.content, terms)
+        or article.short_description
+    )
+
+
+class BaseSearchBackend:
+    """Інтерфейс пошукового бекенду"""
+
+    def index(self, rows, conn=connection):
+        """Проіндексувати статті: rows - (id, title, short_description, content)"""
+        raise NotImplementedError
+
+    def remove(self, ids):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def search(self, terms, limit, offset=0):
+        """Список id статей, відсортованих за релевантністю"""
+        raise NotImplementedError
+
+    def count(self, terms):
+        raise NotImplementedError
+
+    def index_articles(self, articles):
+        """Оновити індекс для статей: опубліковані індексуються, решта видаляється"""
+        published = [a for a in articles if a.status == 'published']
+        self.remove([a.id for a in articles if a.status != 'published'])
+        self.index([(a.id, a.title, a.short_description, a.content) for a in published])
+
+
+class SqliteSearchBackend(BaseSearchBackend):
+    """SQLite FTS5 з ранжуванням bm25"""
+
+    @staticmethod
+    def create_table(conn):
+        with conn.cursor() as cursor:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_TABLE} "
+                f"USING fts5(title, short_description, content, tokenize='unicode61 remove_diacritics 0')"
+            )
+
+    @staticmethod
+    def drop_table(conn):
+        with conn.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS {SQLITE_TABLE}')
+
+    @staticmethod
+    def _match(terms):
+        return ' '.join(f'"{term}"*' for term in terms)
+
+    def index(self, rows, conn=connection):
+        if not rows:
+            return
+        with conn.cursor() as cursor:
+            cursor.executemany(f'DELETE FROM {SQLITE_TABLE} WHERE rowid = %s', [(row[0],) for row in rows])
+            cursor.executemany(
+                f'INSERT INTO {SQLITE_TABLE} (rowid, title, short_description, content) VALUES (%s, %s, %s, %s)',
+                [(pk, analyzed_text(title), analyzed_text(description), analyzed_text(content))
+                 for pk, title, description, content in rows],
+            )
+
+    def remove(self, ids):
+        if not ids:
+            return
+        with connection.cursor() as cursor:
+            cursor.executemany(f'DELETE FROM {SQLITE_TABLE} WHERE rowid = %s', [(pk,) for pk in ids])
+
+    def clear(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {SQLITE_TABLE}')
+
+    def search(self, terms, limit, offset=0):
+        weights = ', '.join(str(weight) for weight in SQLITE_WEIGHTS)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT rowid FROM {SQLITE_TABLE} WHERE {SQLITE_TABLE} MATCH %s '
+                f'ORDER BY bm25({SQLITE_TABLE}, {weights}) LIMIT %s OFFSET %s',
+                [self._match(terms), limit, offset],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+    def count(self, terms):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT COUNT(*) FROM {SQLITE_TABLE} WHERE {SQLITE_TABLE} MATCH %s',
+                [self._match(terms)],
+            )
+            return cursor.fetchone()[0]
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """PostgreSQL tsvector + GIN з ранжуванням ts_rank_cd"""
+
+    @staticmethod
+    def create_table(conn):
+        with conn.cursor() as cursor:
+            cursor.execute(
+                f'CREATE TABLE IF NOT EXISTS {POSTGRES_TABLE} ('
+                f'  article_id bigint PRIMARY KEY REFERENCES articles_article(id) ON DELETE CASCADE,'
+                f'  document tsvector NOT NULL'
+                f')'
+            )
+            cursor.execute(
+                f'CREATE INDEX IF NOT EXISTS {POSTGRES_TABLE}_document_gin '
+                f'ON {POSTGRES_TABLE} USING GIN (document)'
+            )
+
+    @staticmethod
+    def drop_table(conn):
+        with conn.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS {POSTGRES_TABLE}')
+
+    @staticmethod
+    def _tsquery(terms):
+        return ' & '.join("'{}':*".format(term.replace("'", '')) for term in terms)
+
+    def index(self, rows, conn=connection):
+        if not rows:
+            return
+        with conn.cursor() as cursor:
+            cursor.executemany(
+                f"INSERT INTO {POSTGRES_TABLE} (article_id, document) VALUES (%s, "
+                f"setweight(to_tsvector('simple', %s), 'A') || "
+                f"setweight(to_tsvector('simple', %s), 'B') || "
+                f"setweight(to_tsvector('simple', %s), 'C')) "
+                f"ON CONFLICT (article_id) DO UPDATE SET document = EXCLUDED.document",
+                [(pk, analyzed_text(title), analyzed_text(description), analyzed_text(content))
+                 for pk, title, description, content in rows],
+            )
+
+    def remove(self, ids):
+        if not ids:
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {POSTGRES_TABLE} WHERE article_id = ANY(%s)', [list(ids)])
+
+    def clear(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'TRUNCATE {POSTGRES_TABLE}')
+
+    def search(self, terms, limit, offset=0):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT article_id FROM {POSTGRES_TABLE}, to_tsquery('simple', %s) query "
+                f"WHERE document @@ query ORDER BY ts_rank_cd(document, query) DESC, article_id DESC "
+                f"LIMIT %s OFFSET %s",
+                [self._tsquery(terms), limit, offset],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+    def count(self, terms):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT COUNT(*) FROM {POSTGRES_TABLE} WHERE document @@ to_tsquery('simple', %s)",
+                [self._tsquery(terms)],
+            )
+            return cursor.fetchone()[0]
+
+
+class DatabaseSearchBackend(BaseSearchBackend):
+    """Запасний пошук через icontains (без окремого індексу)"""
+
+    @staticmethod
+    def _queryset(terms):
+        from articles.models import Article
+        condition = Q()
+        for term in terms:
+            condition &= (
+                Q(title__icontains=term) |
+                Q(short_description__icontains=term) |
+                Q(content__icontains=term)
+            )
+        return Article.objects.filter(condition, status='published')
+
+    def index(self, rows, conn=connection):
+        pass
+
+    def remove(self, ids):
+        pass
+
+    def clear(self):
+        pass
+
+    def search(self, terms, limit, offset=0):
+        return list(self._queryset(terms).values_list('id', flat=True)[offset:offset + limit])
+
+    def count(self, terms):
+        return self._queryset(terms).count()
+
+
+_backend = None
+
+
+def get_search_backend():
+    """Пошуковий бекенд для поточної БД"""
+    global _backend
+    if _backend is None:
+        try:
+            backend = get_backend_for_connection(connection)
+        except DatabaseError:
+            backend = None
+        if backend is None:
+            logger.warning('Повнотекстовий індекс недоступний, використовується пошук через icontains')
+            backend = DatabaseSearchBackend()
+        _backend = backend
+    return _backend
+
+
+def get_backend_for_connection(conn):
+    """Бекенд з окремою таблицею індексу для з'єднання (None, якщо індексу немає)"""
+    if conn.vendor == 'postgresql':
+        return PostgresSearchBackend()
+    if conn.vendor == 'sqlite' and SQLITE_TABLE in conn.introspection.table_names():
+        return SqliteSearchBackend()
+    return None
+
+
+def create_search_index(conn):
+    """Створити таблицю індексу (викликається з міграції)"""
+    if conn.vendor == 'postgresql':
+        PostgresSearchBackend.create_table(conn)
+    elif conn.vendor == 'sqlite':
+        try:
+            SqliteSearchBackend.create_table(conn)
+        except DatabaseError as e:
+            logger.warning(f'SQLite без підтримки FTS5, пошук працюватиме через icontains: {e}')
+
+
+def drop_search_index(conn):
+    if conn.vendor == 'postgresql':
+        PostgresSearchBackend.drop_table(conn)
+    elif conn.vendor == 'sqlite':
+        SqliteSearchBackend.drop_table(conn)
+
+
+class SearchResults:
+    """
+    Лінива послідовність результатів пошуку для Paginator:
+    count() рахує збіги в індексі, зріз завантажує лише статті сторінки
+    """
+
+    def __init__(self, query, backend=None):
+        self.terms = query_terms(query)
+        self.backend = backend or get_search_backend()
+
+    def count(self):
+        if not self.terms:
+            return 0
+        return self.backend.count(self.terms)
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, index):
+        from articles.models import Article
+        from services.dto import ArticleCard
+
+        if not isinstance(index, slice):
+            return self[index:index + 1][0]
+        if not self.terms:
+            return []
+        offset = index.start or 0
+        limit = (index.stop if index.stop is not None else offset + 100) - offset
+        ids = self.backend.search(self.terms, limit, offset)
+        articles = Article.objects.filter(
+            id__in=ids, status='published'
+        ).select_related('author', 'category').prefetch_related('tags').in_bulk()
+
+        cards = []
+        for pk in ids:
+            article = articles.get(pk)
+            if article is None:
+                continue
+            card = ArticleCard.from_article(article)
+            card.snippet = make_snippet(article, self.terms)
+            cards.append(card)
+        return cards
@@ -0,0 +1,87 @@
+"""
+Денна статистика переглядів та оцінка "популярне зараз"
+
+Буфер переглядів (services/view_counter.py) при кожному скиданні додає
+перегляди до денного кошика ArticleViewStat(article, date). Періодичний
+перерахунок зводить кошики за останні TRENDING_WINDOW_DAYS днів у
+Article.trending_score:
+
+    score = Σ views(день) · 0.5 ^ (вік дня / TRENDING_HALF_LIFE_DAYS)
+
+Колонка проіндексована разом зі статусом, тому "популярне" - це читання
+перших K рядків індексу, а не сортування всіх статей за період.
+"""
+import logging
+from collections import defaultdict
+from datetime import timedelta
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from articles.models import Article, ArticleViewStat
+
+logger = logging.getLogger(__name__)
+
+TRENDING_WINDOW_DAYS = 30
+TRENDING_HALF_LIFE_DAYS = 3
+# Скільки днів зберігати денні кошики
+STATS_RETENTION_DAYS = 90
+# Як часто перераховувати оцінку (не частіше, спільно для всіх воркерів)
+ROLLUP_INTERVAL = 60 * 5
+ROLLUP_LOCK_KEY = 'trending:rollup'
+
+
+class TrendingService:
+    """Денна статистика переглядів і трендова оцінка статей"""
+
+    @staticmethod
+    def record_views(counts, date=None):
+        """
+        Додати перегляди {article_id: n} до денних кошиків.
+        Спершу створюються відсутні кошики, потім усі збільшуються через F(),
+        тож паралельні скидання з різних воркерів не перезаписують одне одного.
+        """
+        if not counts:
+            return
+        date = date or timezone.localdate()
+        existing = set(Article.objects.filter(id__in=counts).values_list('id', flat=True))
+        ArticleViewStat.objects.bulk_create(
+            [ArticleViewStat(article_id=pk, date=date, views=0) for pk in counts if pk in existing],
+            ignore_conflicts=True,
+        )
+        by_amount = defaultdict(list)
+        for article_id, amount in counts.items():
+            by_amount[amount].append(article_id)
+        for amount, ids in by_amount.items():
+            ArticleViewStat.objects.filter(date=date, article_id__in=ids).update(views=F('views') + amount)
+
+    @staticmethod
+    def compute_scores(today=None):
+        """Трендові оцінки {article_id: score} з денних кошиків"""
+        today = today or timezone.localdate()
+        since = today - timedelta(days=TRENDING_WINDOW_DAYS - 1)
+        scores = defaultdict(float)
+        rows = ArticleViewStat.objects.filter(date__gte=since).values_list('article_id', 'date', 'views')
+        for article_id, date, views in rows.iterator():
+            age_days = max((today - date).days, 0)
+            scores[article_id] += views * 0.5 ** (age_days / TRENDING_HALF_LIFE_DAYS)
+        return scores
+
+    @staticmethod
+    def rollup():
+        """Перерахувати Article.trending_score та прибрати старі кошики"""
+        scores = TrendingService.compute_scores()
+        with transaction.atomic():
+            Article.objects.filter(trending_score__gt=0).exclude(id__in=list(scores)).update(trending_score=0)
+            articles = [Article(id=pk, trending_score=round(score, 4)) for pk, score in scores.items()]
+            Article.objects.bulk_update(articles, ['trending_score'], batch_size=500)
+            cutoff = timezone.localdate() - timedelta(days=STATS_RETENTION_DAYS)
+            ArticleViewStat.objects.filter(date__lt=cutoff).delete()
+        logger.info(f'Трендові оцінки оновлено для {len(scores)} статей')
+        return len(scores)
+
+    @staticmethod
+    def maybe_rollup():
+        """Перерахунок не частіше ніж раз на ROLLUP_INTERVAL для всіх воркерів"""
+        if cache.add(ROLLUP_LOCK_KEY, 1, ROLLUP_INTERVAL):
+            TrendingService.rollup()
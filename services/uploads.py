@@ -0,0 +1,162 @@
+"""
+Відновлювані завантаження відео частинами (за зразком протоколу tus)
+
+Браузер створює сесію завантаження (ім'я та розмір файлу), а потім надсилає
+файл частинами з явним зміщенням. Кожна частина - короткий запит, який лише
+дописує байти у тимчасовий файл; після обриву з'єднання браузер дізнається
+поточне зміщення і продовжує з нього. Коли файл отримано повністю, він
+переноситься в storage поля Article.featured_video у фоновому потоці (для
+Cloudinary - частинами, див. articles/storage.py), а форма статті надсилає
+лише id завершеного завантаження.
+"""
+import os
+import logging
+import threading
+from datetime import timedelta
+from django.conf import settings
+from django.core.files import File
+from django.db import connection, transaction
+from django.utils import timezone
+from articles.models import Article, VideoUpload
+
+logger = logging.getLogger(__name__)
+
+# Сесії завантаження, старші за цей час, видаляються
+UPLOAD_EXPIRY = timedelta(days=1)
+COPY_BUFFER_SIZE = 64 * 1024
+VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm', '.mkv', '.m4v')
+
+
+class UploadError(Exception):
+    """Некоректний запит до завантаження (повертається клієнту як 400)"""
+
+
+class OffsetMismatch(UploadError):
+    """Зміщення частини не збігається з уже отриманими байтами"""
+
+    def __init__(self, offset):
+        super().__init__(f'Очікувалось зміщення {offset}')
+        self.offset = offset
+
+
+class ResumableUploadService:
+    """Сесії відновлюваних завантажень і перенесення готових файлів у storage"""
+
+    @staticmethod
+    def spool_path(upload):
+        return os.path.join(settings.RESUMABLE_UPLOAD_DIR, f'{upload.pk}.part')
+
+    @staticmethod
+    def create(user, filename, size):
+        filename = os.path.basename(filename or '').strip()
+        if not filename.lower().endswith(VIDEO_EXTENSIONS):
+            raise UploadError('Підтримуються лише відеофайли')
+        if not isinstance(size, int) or size <= 0:
+            raise UploadError('Некоректний розмір файлу')
+        if size > settings.RESUMABLE_UPLOAD_MAX_SIZE:
+            raise UploadError(f'Файл більший за {settings.RESUMABLE_UPLOAD_MAX_SIZE // 1024 ** 2} МБ')
+
+        ResumableUploadService.cleanup_stale()
+        os.makedirs(settings.RESUMABLE_UPLOAD_DIR, exist_ok=True)
+        upload = VideoUpload.objects.create(created_by=user, filename=filename, size=size)
+        open(ResumableUploadService.spool_path(upload), 'wb').close()
+        return upload
+
+    @staticmethod
+    def append(upload_id, offset, stream, length):
+        """
+        Дописати частину length байт з stream, що починається з offset.
+        Повертає оновлену сесію; коли файл отримано повністю - запускає
+        перенесення у storage.
+        """
+        if length <= 0 or length > settings.RESUMABLE_UPLOAD_CHUNK_SIZE:
+            raise UploadError(f'Розмір частини має бути від 1 до {settings.RESUMABLE_UPLOAD_CHUNK_SIZE} байт')
+
+        with transaction.atomic():
+            # Блокування рядка: паралельні запити до однієї сесії не перемішують байти
+            upload = VideoUpload.objects.select_for_update().get(pk=upload_id)
+            if upload.status != VideoUpload.STATUS_UPLOADING:
+                raise UploadError('Завантаження вже завершено')
+            if offset != upload.offset:
+                raise OffsetMismatch(upload.offset)
+            if offset + length > upload.size:
+                raise UploadError('Частина виходить за межі файлу')
+
+            path = ResumableUploadService.spool_path(upload)
+            received = 0
+            with open(path, 'r+b') as f:
+                # Відкидаємо хвіст частини, обірваної посеред запису
+                f.truncate(offset)
+                f.seek(offset)
+                while received < length:
+                    data = stream.read(min(COPY_BUFFER_SIZE, length - received))
+                    if not data:
+                        break
+                    f.write(data)
+                    received += len(data)
+            if received != length:
+                raise UploadError('Частину отримано не повністю')
+
+            upload.offset = offset + received
+            if upload.offset == upload.size:
+                upload.status = VideoUpload.STATUS_PROCESSING
+            upload.save(update_fields=['offset', 'status', 'updated_at'])
+
+        if upload.status == VideoUpload.STATUS_PROCESSING:
+            transaction.on_commit(lambda: ResumableUploadService.finalize_in_background(upload.pk))
+        return upload
+
+    @staticmethod
+    def finalize(upload_id, storage=None):
+        """Перенести отриманий файл у storage поля featured_video"""
+        upload = VideoUpload.objects.get(pk=upload_id)
+        field = Article._meta.get_field('featured_video')
+        storage = storage or field.storage
+        path = ResumableUploadService.spool_path(upload)
+        try:
+            with open(path, 'rb') as f:
+                name = storage.save(field.generate_filename(Article(), upload.filename), File(f, name=upload.filename))
+        except Exception as e:
+            logger.exception(f'Не вдалося зберегти відео {upload.filename}')
+            upload.status = VideoUpload.STATUS_FAILED
+            upload.error = str(e)
+            upload.save(update_fields=['status', 'error', 'updated_at'])
+            return upload
+        upload.status = VideoUpload.STATUS_COMPLETE
+        upload.asset_name = name
+        upload.save(update_fields=['status', 'asset_name', 'updated_at'])
+        os.remove(path)
+        logger.info(f'Відео {upload.filename} збережено як {name}')
+        return upload
+
+    @staticmethod
+    def finalize_in_background(upload_id):
+        """Перенесення в storage не займає воркер, що обслуговує запити"""
+        def run():
+            try:
+                ResumableUploadService.finalize(upload_id)
+            finally:
+                connection.close()
+
+        threading.Thread(target=run, name=f'video-upload-{upload_id}', daemon=True).start()
+
+    @staticmethod
+    def abort(upload_id):
+        upload = VideoUpload.objects.filter(pk=upload_id).first()
+        if upload is None:
+            return
+        try:
+            os.remove(ResumableUploadService.spool_path(upload))
+        except FileNotFoundError:
+            pass
+        upload.delete()
+
+    @staticmethod
+    def cleanup_stale():
+        """
+        Видалити старі сесії разом з тимчасовими файлами: покинуті незавершені
+        та завершені (стаття вже зберігає ім'я файлу в storage, а не сесію)
+        """
+        stale = VideoUpload.objects.filter(updated_at__lt=timezone.now() - UPLOAD_EXPIRY)
+        for upload_id in stale.values_list('pk', flat=True):
+            ResumableUploadService.abort(upload_id)
@@ -0,0 +1,203 @@
+"""
+Буферизований лічильник переглядів статей (write-behind)
+
+Перегляд не пише в БД: він лише збільшує лічильник у буфері.
+Фоновий потік кожні VIEWS_FLUSH_INTERVAL секунд переносить накопичене
+в БД пакетом UPDATE ... SET views_count = views_count + n (один запит на
+кожне різне n), тому конкурентні перегляди не губляться і запит
+сторінки не чекає на запис. Ті самі перегляди додаються до денної статистики
+(services/trending.py), з якої періодично перераховується трендова оцінка.
+Унікальні відвідувачі накопичуються у скетчах HyperLogLog воркера
+(services/readers.py) і зливаються з денними скетчами при тому ж скиданні.
+
+Буфер:
+- Redis (якщо спільний кеш - RedisCache): хеш, спільний для всіх воркерів,
+  його також скидає команда flush_view_counts;
+- інакше - пам'ять воркера, скидається також при завершенні процесу.
+"""
+import os
+import time
+import uuid
+import atexit
+import logging
+import threading
+from collections import Counter, defaultdict
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.redis import RedisCache
+from django.db import connections, transaction
+from django.db.models import F
+from articles.models import Article
+from services.trending import TrendingService
+from services.readers import UniqueReaderService
+from services.hll import HyperLogLog
+
+logger = logging.getLogger(__name__)
+
+FLUSH_INTERVAL = getattr(settings, 'VIEWS_FLUSH_INTERVAL', 10)
+# Скинути буфер пам'яті (або скетчі читачів) достроково, якщо в ньому стільки статей
+MAX_PENDING = 1000
+REDIS_KEY = 'views:pending'
+
+
+class MemoryViewBuffer:
+    """Лічильники в пам'яті процесу"""
+
+    shared = False
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = Counter()
+
+    def add(self, article_id, amount=1):
+        with self._lock:
+            self._counts[article_id] += amount
+            return len(self._counts)
+
+    def add_many(self, counts):
+        with self._lock:
+            self._counts.update(counts)
+
+    def drain(self):
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+        return dict(counts)
+
+
+class RedisViewBuffer:
+    """Лічильники в хеші Redis, спільному для всіх воркерів"""
+
+    shared = True
+
+    def __init__(self, cache):
+        self._cache = cache
+        self._key = cache.make_key(REDIS_KEY)
+
+    def _client(self):
+        return self._cache._cache.get_client(self._key, write=True)
+
+    def add(self, article_id, amount=1):
+        self._client().hincrby(self._key, article_id, amount)
+        return 0
+
+    def add_many(self, counts):
+        pipe = self._client().pipeline()
+        for article_id, amount in counts.items():
+            pipe.hincrby(self._key, article_id, amount)
+        pipe.execute()
+
+    def drain(self):
+        from redis.exceptions import ResponseError
+
+        client = self._client()
+        # RENAME атомарний: кожне значення забере рівно один воркер
+        flushing = f'{self._key}:flushing:{uuid.uuid4().hex}'
+        try:
+            client.rename(self._key, flushing)
+        except ResponseError:
+            return {}  # немає накопичених переглядів
+        pipe = client.pipeline()
+        pipe.hgetall(flushing)
+        pipe.delete(flushing)
+        values, _ = pipe.execute()
+        return {int(article_id): int(amount) for article_id, amount in values.items()}
+
+
+def _make_buffer():
+    shared = caches['shared'] if 'shared' in settings.CACHES else caches['default']
+    if isinstance(shared, RedisCache):
+        return RedisViewBuffer(shared)
+    return MemoryViewBuffer()
+
+
+class ViewCounter:
+    """Облік переглядів з відкладеним записом у БД"""
+
+    def __init__(self, flush_interval=FLUSH_INTERVAL):
+        self.flush_interval = flush_interval
+        self._buffer = None
+        self._pid = None
+        self._flush_lock = threading.Lock()
+        self._sketch_lock = threading.Lock()
+        self._sketches = {}  # article_id -> HyperLogLog читачів з останнього скидання
+
+    @property
+    def buffer(self):
+        # Після fork (gunicorn) кожен воркер заводить власний буфер і потік
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._buffer = _make_buffer()
+            self._sketches = {}
+            self._start_flusher()
+        return self._buffer
+
+    def _start_flusher(self):
+        thread = threading.Thread(target=self._flush_loop, name='view-counter-flush', daemon=True)
+        thread.start()
+        atexit.register(self.flush)
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+                TrendingService.maybe_rollup()
+            except Exception as e:
+                logger.error(f'Помилка фонового оновлення переглядів: {e}')
+            finally:
+                connections.close_all()
+
+    def record(self, article_id, visitor=None):
+        """Зарахувати перегляд статті (без звернення до БД); visitor - id для унікальних читачів"""
+        try:
+            pending = self.buffer.add(article_id)
+        except Exception as e:
+            logger.warning(f'Не вдалося зарахувати перегляд статті {article_id}: {e}')
+            return
+        if visitor is not None:
+            with self._sketch_lock:
+                sketch = self._sketches.get(article_id)
+                if sketch is None:
+                    sketch = self._sketches[article_id] = HyperLogLog()
+                sketch.add(visitor)
+                pending = max(pending, len(self._sketches))
+        if pending >= MAX_PENDING:
+            threading.Thread(target=self.flush, daemon=True).start()
+
+    def flush(self):
+        """Записати накопичені перегляди в БД; повертає кількість записаних переглядів"""
+        with self._flush_lock:
+            try:
+                counts = self.buffer.drain()
+            except Exception as e:
+                logger.warning(f'Не вдалося прочитати буфер переглядів: {e}')
+                return 0
+            with self._sketch_lock:
+                sketches, self._sketches = self._sketches, {}
+            if not counts and not sketches:
+                return 0
+
+            by_amount = defaultdict(list)
+            for article_id, amount in counts.items():
+                by_amount[amount].append(article_id)
+            try:
+                with transaction.atomic():
+                    for amount, ids in by_amount.items():
+                        Article.objects.filter(id__in=ids).update(views_count=F('views_count') + amount)
+                    TrendingService.record_views(counts)
+                    UniqueReaderService.record_sketches(sketches)
+            except Exception as e:
+                logger.error(f'Не вдалося записати перегляди в БД, повертаємо їх у буфер: {e}')
+                self.buffer.add_many(counts)
+                with self._sketch_lock:
+                    for article_id, sketch in sketches.items():
+                        current = self._sketches.get(article_id)
+                        self._sketches[article_id] = current.merge(sketch) if current else sketch
+                return 0
+
+            total = sum(counts.values())
+            logger.debug(f'Записано {total} переглядів для {len(counts)} статей')
+            return total
+
+
+view_counter = ViewCounter()
@@ -0,0 +1,170 @@
+// ============================================
+// ВІДНОВЛЮВАНЕ ЗАВАНТАЖЕННЯ ВІДЕО В АДМІНЦІ
+// Файл надсилається частинами (services/uploads.py), форма статті
+// отримує лише id завершеного завантаження
+// ============================================
+
+(function() {
+    'use strict';
+
+    const MAX_RETRIES = 5;
+    const POLL_INTERVAL = 2000;
+
+    function getCookie(name) {
+        const match = document.cookie.match(new RegExp('(?:^|; )' + name + '=([^;]*)'));
+        return match ? decodeURIComponent(match[1]) : '';
+    }
+
+    function sleep(ms) {
+        return new Promise(resolve => setTimeout(resolve, ms));
+    }
+
+    function formatSize(bytes) {
+        return (bytes / 1024 / 1024).toFixed(1) + ' МБ';
+    }
+
+    function request(url, options) {
+        options.headers = Object.assign({'X-CSRFToken': getCookie('csrftoken')}, options.headers || {});
+        options.credentials = 'same-origin';
+        return fetch(url, options);
+    }
+
+    // Повтор запиту при обриві з'єднання або помилці сервера, з наростаючою затримкою
+    async function withRetries(send) {
+        for (let attempt = 0; ; attempt++) {
+            try {
+                const response = await send();
+                if (response.status < 500) {
+                    return response;
+                }
+                throw new Error(response.statusText);
+            } catch (error) {
+                if (attempt >= MAX_RETRIES) {
+                    throw error;
+                }
+                await sleep(1000 * Math.pow(2, attempt));
+            }
+        }
+    }
+
+    // Сесія зберігається в localStorage, щоб продовжити після перезавантаження сторінки
+    function storageKey(file) {
+        return 'resumable-upload:' + file.name + ':' + file.size + ':' + file.lastModified;
+    }
+
+    async function openSession(container, file) {
+        const key = storageKey(file);
+        const savedUrl = localStorage.getItem(key);
+        if (savedUrl) {
+            const response = await withRetries(() => request(savedUrl, {method: 'GET'}));
+            if (response.ok) {
+                const state = await response.json();
+                if (state.status !== 'failed') {
+                    return {url: savedUrl, state: state};
+                }
+            }
+            localStorage.removeItem(key);
+        }
+
+        const response = await withRetries(() => request(container.dataset.createUrl, {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({filename: file.name, size: file.size}),
+        }));
+        const state = await response.json();
+        if (!response.ok) {
+            throw new Error(state.error || response.statusText);
+        }
+        const url = response.headers.get('Location');
+        localStorage.setItem(key, url);
+        return {url: url, state: state};
+    }
+
+    async function upload(container, file, setStatus) {
+        const chunkSize = parseInt(container.dataset.chunkSize, 10);
+        const session = await openSession(container, file);
+        let state = session.state;
+
+        while (state.status === 'uploading') {
+            const offset = state.offset;
+            const chunk = file.slice(offset, offset + chunkSize);
+            const response = await withRetries(() => request(session.url, {
+                method: 'PATCH',
+                headers: {
+                    'Upload-Offset': String(offset),
+                    'Content-Type': 'application/offset+octet-stream',
+                },
+                body: chunk,
+            }));
+            const body = await response.json();
+            // 409 - сервер вже має інше зміщення (наприклад, після обриву), продовжуємо з нього
+            if (!response.ok && response.status !== 409) {
+                throw new Error(body.error || response.statusText);
+            }
+            state = body;
+            setStatus(state.offset / file.size, 'Завантажено ' + formatSize(state.offset) + ' з ' + formatSize(file.size));
+        }
+
+        while (state.status === 'processing') {
+            setStatus(1, 'Збереження у сховищі...');
+            await sleep(POLL_INTERVAL);
+            const response = await withRetries(() => request(session.url, {method: 'GET'}));
+            state = await response.json();
+        }
+
+        localStorage.removeItem(storageKey(file));
+        if (state.status !== 'complete') {
+            throw new Error(state.error || 'Не вдалося зберегти відео');
+        }
+        return state.id;
+    }
+
+    function init(container) {
+        const fileInput = container.querySelector('input[type="file"]');
+        const hiddenInput = container.querySelector('input[type="hidden"]');
+        const progress = container.querySelector('progress');
+        const statusText = container.querySelector('.resumable-upload-status');
+        const form = container.closest('form');
+        const fieldName = fileInput.name;
+        let busy = false;
+
+        function setStatus(fraction, text) {
+            progress.hidden = false;
+            progress.value = fraction;
+            statusText.textContent = text;
+        }
+
+        fileInput.addEventListener('change', async function() {
+            const file = fileInput.files[0];
+            hiddenInput.value = '';
+            if (!file) {
+                fileInput.name = fieldName;
+                return;
+            }
+            // Сам файл не надсилається разом з формою
+            fileInput.removeAttribute('name');
+            busy = true;
+            try {
+                hiddenInput.value = await upload(container, file, setStatus);
+                setStatus(1, '✓ Відео завантажено: ' + file.name);
+            } catch (error) {
+                statusText.textContent = '✗ ' + error.message + '. Оберіть той самий файл ще раз, щоб продовжити.';
+            } finally {
+                busy = false;
+            }
+        });
+
+        if (form) {
+            form.addEventListener('submit', function(event) {
+                if (busy) {
+                    event.preventDefault();
+                    alert('Дочекайтеся завершення завантаження відео');
+                }
+            });
+        }
+    }
+
+    document.addEventListener('DOMContentLoaded', function() {
+        document.querySelectorAll('.resumable-upload').forEach(init);
+    });
+})();